@@ -26,6 +26,7 @@ import base64
 import asyncio
 import requests
 import toml
+from empire_job_queue import claim_job, ensure_queue
 import feedparser
 from datetime import date, datetime
 
@@ -77,6 +78,12 @@ class DatabaseManager:
             )""")
             conn.execute("CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT)")
             conn.execute("INSERT OR IGNORE INTO settings (key,value) VALUES ('system_status', 'RUNNING')")
+            ensure_queue(conn)
+
+    def claim_job(self, fields):
+        """Leased claim of the next Ready post (shared empire_job_queue)."""
+        with self.get_conn() as conn:
+            return claim_job(conn, fields)
 
     def seed_data(self):
         """Pre-loads the Blue Collar SaaS List."""
@@ -283,8 +290,7 @@ async def pipeline_worker():
         intel_eng.scan_rss()
         
         # 2. Check Job Queue
-        with db.get_conn() as conn:
-            job = conn.execute("SELECT id, name, link, app_url, category FROM posts WHERE status='Ready' LIMIT 1").fetchone()
+        job = db.claim_job("id, name, link, app_url, category")
         
         if job:
             _id, name, link, app_url, category = job
@@ -312,14 +318,14 @@ async def pipeline_worker():
                 
                 # Step F: Commit
                 with db.get_conn() as conn:
-                    conn.execute("UPDATE posts SET status='Published', image_url=?, video_path=?, social_json=?, price_intel=? WHERE id=?", 
+                    conn.execute("UPDATE posts SET status='Published', claimed_by=NULL, lease_until=NULL, image_url=?, video_path=?, social_json=?, price_intel=? WHERE id=?", 
                                  (str(img), str(vid), json.dumps(data), intel['price'], _id))
                     conn.commit()
                 logging.info(f"✅ Published: {name}")
                 
             except Exception as e:
                 logging.error(f"❌ Error: {e}")
-                with db.get_conn() as conn: conn.execute("UPDATE posts SET status='Failed' WHERE id=?", (_id,)); conn.commit()
+                with db.get_conn() as conn: conn.execute("UPDATE posts SET status='Failed', claimed_by=NULL, lease_until=NULL WHERE id=?", (_id,)); conn.commit()
         
         time.sleep(60)
 
@@ -349,7 +355,7 @@ except: c2.warning("God Mode: LITE")
 c3.metric("Zapier Bridge", "Connected" if "zapier" in open(".streamlit/secrets.toml").read() else "Disconnected")
 
 conn = get_conn()
-ready = conn.execute("SELECT COUNT(*) FROM posts WHERE status='Ready'").fetchone()[0]
+ready = conn.execute("SELECT COUNT(*) FROM posts WHERE status IN ('Ready','Claimed')").fetchone()[0]
 conn.close()
 c4.metric("In Queue", ready)
 
@@ -440,11 +446,96 @@ zapier_webhook = ""
 daily_run_limit = 5
 """
 
+# Leased job queue shared with the other engine editions (empire_job_queue.py).
+JOB_QUEUE_CODE = r'''"""Leased job queue over the ``posts`` table of empire.db.
+
+Shared by the engine editions (V52, V64 Apex, V61 UNITY, V68); each
+installer embeds a copy as ``JOB_QUEUE_CODE`` and writes it next to the
+``engine.py`` it installs, so keep those copies in step with this file.
+
+A worker claims the highest-priority ``Ready`` post, which moves it to
+``Claimed`` with a lease. Other workers cannot see it until the lease runs
+out (a crashed worker), after which it is handed out again, or marked
+``Failed`` once ``MAX_ATTEMPTS`` claims have been used up. Whatever final
+status the engine writes should also clear ``claimed_by``/``lease_until``.
+"""
+
+import os
+import socket
+import sqlite3
+import time
+
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+CLAIM_LEASE_SEC = 1800
+MAX_ATTEMPTS = 3
+
+CLAIM_COLUMNS = (
+    ("priority", "INTEGER DEFAULT 0"),
+    ("claimed_by", "TEXT"),
+    ("lease_until", "REAL"),
+    ("attempts", "INTEGER DEFAULT 0"),
+)
+
+# UPDATE ... RETURNING arrived in SQLite 3.35.
+HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35)
+
+
+def ensure_queue(conn):
+    """Add the claim columns and the (status, priority, id) index if missing."""
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(posts)")}
+    for column, decl in CLAIM_COLUMNS:
+        if column not in existing:
+            conn.execute(f"ALTER TABLE posts ADD COLUMN {column} {decl}")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_posts_queue ON posts (status, priority DESC, id)"
+    )
+
+
+def claim_job(conn, fields, lease_sec=CLAIM_LEASE_SEC, max_attempts=MAX_ATTEMPTS,
+              worker_id=WORKER_ID):
+    """Claim the next Ready post and return ``fields`` of it, or None.
+
+    Runs as one IMMEDIATE transaction, so concurrent workers never receive
+    the same post; both lookups walk idx_posts_queue instead of scanning.
+    """
+    now = time.time()
+    conn.execute("BEGIN IMMEDIATE")
+    with conn:
+        conn.execute(
+            "UPDATE posts SET status = CASE WHEN attempts >= ? THEN 'Failed' ELSE 'Ready' END, "
+            "claimed_by = NULL, lease_until = NULL "
+            "WHERE status = 'Claimed' AND lease_until < ?",
+            (max_attempts, now),
+        )
+        claim = (
+            "UPDATE posts SET status = 'Claimed', claimed_by = ?, lease_until = ?, "
+            "attempts = attempts + 1 WHERE id = {target}"
+        )
+        if HAS_RETURNING:
+            rows = conn.execute(
+                claim.format(
+                    target="(SELECT id FROM posts WHERE status = 'Ready' "
+                    "ORDER BY priority DESC, id LIMIT 1)"
+                ) + f" RETURNING {fields}",
+                (worker_id, now + lease_sec),
+            ).fetchall()
+            return rows[0] if rows else None
+
+        row = conn.execute(
+            "SELECT id FROM posts WHERE status = 'Ready' ORDER BY priority DESC, id LIMIT 1"
+        ).fetchone()
+        if row is None:
+            return None
+        conn.execute(claim.format(target="?"), (worker_id, now + lease_sec, row[0]))
+        return conn.execute(f"SELECT {fields} FROM posts WHERE id = ?", (row[0],)).fetchone()
+'''
+
 def install():
     os.makedirs(PROJECT_DIR, exist_ok=True)
     os.makedirs(os.path.join(PROJECT_DIR, ".streamlit"), exist_ok=True)
     
     with open(os.path.join(PROJECT_DIR, "engine.py"), "w", encoding="utf-8") as f: f.write(ENGINE_CODE)
+    with open(os.path.join(PROJECT_DIR, "empire_job_queue.py"), "w", encoding="utf-8") as f: f.write(JOB_QUEUE_CODE)
     with open(os.path.join(PROJECT_DIR, "dtf_hq.py"), "w", encoding="utf-8") as f: f.write(DASH_CODE)
     with open(os.path.join(PROJECT_DIR, "requirements.txt"), "w", encoding="utf-8") as f: f.write(REQ_TXT)
     with open(os.path.join(PROJECT_DIR, "launch.bat"), "w", encoding="utf-8") as f: f.write(LAUNCH_BAT)
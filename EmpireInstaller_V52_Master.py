@@ -8,18 +8,24 @@ PROJECT_DIR = "DTF_Command_HQ_V52"
 # I. ENGINE CODE (V52 MASTER)
 # =========================
 ENGINE_CODE = r'''import base64
+import atexit
+import contextlib
 import json
 import logging
 import os
+import queue
 import re
 import shutil
 import sqlite3
+import threading
 import time
 import sys
+from collections import deque
 from datetime import date, datetime
 
 import requests
 import toml
+from empire_job_queue import CLAIM_LEASE_SEC, claim_job, ensure_queue
 # Moviepy is the last dependency to load as it is often complex
 try:
     from moviepy.editor import AudioFileClip, ColorClip, CompositeVideoClip, ImageClip
@@ -33,6 +39,27 @@ try:
 except ImportError:
     psutil = None
 
+# The Overseer listens for token pressure on the shared event bus; the engine
+# still runs standalone when the V77 packages are not installed.
+try:
+    from core_infrastructure.event_bus_interface.event_bus import event_bus
+except ImportError:
+    event_bus = None
+
+# With the V77 Overseer installed, the engine hosts its scheduler so mode
+# actions (heavy-job limits, scout batches) apply to this process.
+try:
+    from strategic_oversight.overseer_controller import OverseerController
+    from strategic_oversight.overseer_mode_manager import sqlite_signal_source
+    from strategic_oversight.overseer_scheduler import (
+        SCOUT_JOB_TOPIC,
+        OverseerScheduler,
+        media_concurrency,
+    )
+except ImportError:
+    OverseerScheduler = None
+    media_concurrency = None
+
 # -----------------------------------------
 # CONFIG
 # -----------------------------------------
@@ -95,105 +122,292 @@ logging.basicConfig(
 # -----------------------------------------
 # DB HELPERS
 # -----------------------------------------
+class ConnectionManager:
+    """One long-lived SQLite connection per thread.
+
+    Helpers used to connect and close on every call; a single autopilot
+    iteration paid a dozen opens plus the pragma setup each time. Connections
+    are now opened once per thread, tuned once, and keep their prepared
+    statement cache (keyed by SQL text) for the life of the process.
+    """
+
+    PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA cache_size=-16000",
+        "PRAGMA temp_store=MEMORY",
+    )
+
+    def __init__(self, path, timeout=30, cached_statements=256):
+        self.path = path
+        self.timeout = timeout
+        self.cached_statements = cached_statements
+        self._local = threading.local()
+        self._all = []
+        self._lock = threading.Lock()
+
+    def get(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path,
+                timeout=self.timeout,
+                cached_statements=self.cached_statements,
+            )
+            for pragma in self.PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+            with self._lock:
+                self._all.append(conn)
+        return conn
+
+    def close_all(self):
+        with self._lock:
+            conns, self._all = self._all, []
+        for conn in conns:
+            try:
+                conn.close()
+            except Exception:
+                pass
+        self._local = threading.local()
+
+
+db = ConnectionManager(DB_FILE)
+
+
 def get_conn():
-    return sqlite3.connect(DB_FILE)
+    """Shared connection for the calling thread. Do not close it."""
+    return db.get()
 
 
-def init_db():
-    conn = get_conn()
-    c = conn.cursor()
+# -----------------------------------------
+# SCHEMA MIGRATIONS
+# -----------------------------------------
+def _columns(conn, table):
+    return {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
 
-    c.execute(
-        """
-        CREATE TABLE IF NOT EXISTS posts (
-            id INTEGER PRIMARY KEY,
-            name TEXT UNIQUE,
-            niche TEXT,
-            link TEXT,
-            status TEXT,
-            app_url TEXT,
-            image_url TEXT,
-            video_path TEXT,
-            created_at TEXT
+
+def _add_columns(conn, table, columns):
+    existing = _columns(conn, table)
+    for column, decl in columns:
+        if column not in existing:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+
+
+def _migrate_secondary_indexes(conn):
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_run_log_date ON run_log (run_date)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_error_log_created ON error_log (created_at)")
+    # posts.category only exists in databases shared with the V64+ editions.
+    if "category" in _columns(conn, "posts"):
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_posts_category ON posts (category, status)"
         )
-        """
+
+
+def _migrate_error_day(conn):
+    # A plain YYYY-MM-DD column turns "errors today" into an index lookup
+    # instead of a LIKE over every created_at.
+    _add_columns(conn, "error_log", (("created_day", "TEXT"),))
+    conn.execute(
+        "UPDATE error_log SET created_day = substr(created_at, 1, 10) "
+        "WHERE created_day IS NULL AND created_at IS NOT NULL"
     )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_error_log_day ON error_log (created_day)")
 
-    c.execute(
-        """
-        CREATE TABLE IF NOT EXISTS run_log (
-            id INTEGER PRIMARY KEY,
-            run_date TEXT,
-            item_name TEXT
-        )
-        """
+
+def _migrate_error_occurrences(conn):
+    _add_columns(conn, "error_log", (
+        ("occurrences", "INTEGER DEFAULT 1"),
+        ("last_seen_at", "TEXT"),
+    ))
+
+
+def _migrate_error_last_seen_index(conn):
+    # A deduped row covers up to ERROR_DEDUPE_SEC of a burst, so time
+    # filters (dashboard, Overseer error rate) go by its last occurrence.
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_error_log_last_seen "
+        "ON error_log (COALESCE(last_seen_at, created_at))"
     )
 
-    c.execute(
+
+# (version, description, step). Append only; never renumber a shipped step.
+MIGRATIONS = (
+    (1, "job queue claim columns", ensure_queue),
+    (2, "secondary indexes", _migrate_secondary_indexes),
+    (3, "error_log.created_day", _migrate_error_day),
+    (4, "error_log.occurrences", _migrate_error_occurrences),
+    (5, "error_log last-seen index", _migrate_error_last_seen_index),
+)
+
+
+def migrate(conn):
+    """Bring the schema up to the latest MIGRATIONS version.
+
+    Each step runs in its own IMMEDIATE transaction together with its
+    schema_version row, so a crash leaves the database at a clean version and
+    two processes starting at once apply every step exactly once.
+    """
+    conn.execute(
         """
-        CREATE TABLE IF NOT EXISTS settings (
-            key TEXT PRIMARY KEY,
-            value TEXT
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            description TEXT,
+            applied_at TEXT
         )
         """
     )
+    conn.commit()
+    for version, description, step in MIGRATIONS:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            current = conn.execute(
+                "SELECT COALESCE(MAX(version), 0) FROM schema_version"
+            ).fetchone()[0]
+            if version <= current:
+                conn.rollback()
+                continue
+            step(conn)
+            conn.execute(
+                "INSERT INTO schema_version (version, description, applied_at) "
+                "VALUES (?, ?, ?)",
+                (version, description, datetime.utcnow().isoformat()),
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        logging.info("Applied schema migration %d: %s", version, description)
 
-    c.execute(
-        """
-        CREATE TABLE IF NOT EXISTS error_log (
-            id INTEGER PRIMARY KEY,
-            item_name TEXT,
-            stage TEXT,
-            message TEXT,
-            created_at TEXT
+
+def init_db():
+    conn = get_conn()
+    with conn:
+        c = conn.cursor()
+
+        c.execute(
+            """
+            CREATE TABLE IF NOT EXISTS posts (
+                id INTEGER PRIMARY KEY,
+                name TEXT UNIQUE,
+                niche TEXT,
+                link TEXT,
+                status TEXT,
+                app_url TEXT,
+                image_url TEXT,
+                video_path TEXT,
+                created_at TEXT
+            )
+            """
         )
-        """
-    )
 
-    c.execute(
-        """
-        INSERT OR IGNORE INTO settings (key, value)
-        VALUES ('system_status', 'RUNNING')
-        """
-    )
+        c.execute(
+            """
+            CREATE TABLE IF NOT EXISTS run_log (
+                id INTEGER PRIMARY KEY,
+                run_date TEXT,
+                item_name TEXT
+            )
+            """
+        )
 
-    defaults = {
-        "throttle_cpu": "75",
-        "pause_cpu": "90",
-        "throttle_ram": "80",
-        "pause_ram": "95",
-    }
-    for k, v in defaults.items():
         c.execute(
-            "INSERT OR IGNORE INTO settings (key, value) VALUES (?, ?)",
-            (k, v),
+            """
+            CREATE TABLE IF NOT EXISTS settings (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            )
+            """
         )
 
-    conn.commit()
-    conn.close()
+        c.execute(
+            """
+            CREATE TABLE IF NOT EXISTS error_log (
+                id INTEGER PRIMARY KEY,
+                item_name TEXT,
+                stage TEXT,
+                message TEXT,
+                created_at TEXT
+            )
+            """
+        )
+
+        c.execute(
+            """
+            INSERT OR IGNORE INTO settings (key, value)
+            VALUES ('system_status', 'RUNNING')
+            """
+        )
+
+        defaults = {
+            "throttle_cpu": "75",
+            "pause_cpu": "90",
+            "throttle_ram": "80",
+            "pause_ram": "95",
+            "token_limit_hour": "250000",
+            "cost_limit_hour": "5.00",
+            "token_pressure_release": "0.8",
+            "scout_pending_cap": "10",
+            "cooldown_delay": "300",
+        }
+        for k, v in defaults.items():
+            c.execute(
+                "INSERT OR IGNORE INTO settings (key, value) VALUES (?, ?)",
+                (k, v),
+            )
+    migrate(conn)
+
+
+class SettingsCache:
+    """Process-local copy of the settings table.
+
+    The loop reads half a dozen settings per iteration; each read is now a
+    dict lookup plus one PRAGMA data_version on a dedicated connection. That
+    counter moves whenever any other connection commits (the dashboard's
+    Stop/Resume, or this process's own helpers), and only then is the whole
+    table reloaded.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._conn = None
+        self._lock = threading.Lock()
+        self._version = None
+        self._values = {}
+
+    def get(self, key, default=None):
+        with self._lock:
+            if self._conn is None:
+                self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            if version != self._version:
+                self._values = dict(self._conn.execute("SELECT key, value FROM settings"))
+                self._version = version
+            return self._values.get(key, default)
+
+    def invalidate(self):
+        with self._lock:
+            self._version = None
+
+
+settings_cache = SettingsCache(DB_FILE)
 
 
 def get_setting(key, default=None):
-    conn = get_conn()
-    c = conn.cursor()
-    c.execute("SELECT value FROM settings WHERE key = ?", (key,))
-    row = c.fetchone()
-    conn.close()
-    if row:
-        return row[0]
-    return default
+    return settings_cache.get(key, default)
 
 
 def set_setting(key, value):
     conn = get_conn()
-    c = conn.cursor()
-    c.execute(
-        "INSERT INTO settings (key, value) VALUES (?, ?) "
-        "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
-        (key, value),
-    )
-    conn.commit()
-    conn.close()
+    with conn:
+        c = conn.cursor()
+        c.execute(
+            "INSERT INTO settings (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+    settings_cache.invalidate()
 
 
 def check_budget(daily_limit: int) -> bool:
@@ -202,65 +416,62 @@ def check_budget(daily_limit: int) -> bool:
     today = str(date.today())
     c.execute("SELECT COUNT(*) FROM run_log WHERE run_date = ?", (today,))
     count = c.fetchone()[0]
-    conn.close()
     return count < daily_limit
 
 
 def log_run(item_name: str):
     conn = get_conn()
-    c = conn.cursor()
-    c.execute(
-        "INSERT INTO run_log (run_date, item_name) VALUES (?, ?)",
-        (str(date.today()), item_name),
-    )
-    conn.commit()
-    conn.close()
+    with conn:
+        c = conn.cursor()
+        c.execute(
+            "INSERT INTO run_log (run_date, item_name) VALUES (?, ?)",
+            (str(date.today()), item_name),
+        )
 
 
 def update_status(name: str, status: str):
     conn = get_conn()
-    c = conn.cursor()
-    c.execute("UPDATE posts SET status = ? WHERE name = ?", (status, name))
-    conn.commit()
-    conn.close()
+    with conn:
+        c = conn.cursor()
+        # Any status change ends the post's claim.
+        c.execute(
+            "UPDATE posts SET status = ?, claimed_by = NULL, lease_until = NULL "
+            "WHERE name = ?",
+            (status, name),
+        )
 
 
 def update_media_paths(name: str, image_url: str, video_path: str):
     conn = get_conn()
-    c = conn.cursor()
-    c.execute(
-        "UPDATE posts SET image_url = ?, video_path = ? WHERE name = ?",
-        (image_url, video_path, name),
-    )
-    conn.commit()
-    conn.close()
+    with conn:
+        c = conn.cursor()
+        c.execute(
+            "UPDATE posts SET image_url = ?, video_path = ? WHERE name = ?",
+            (image_url, video_path, name),
+        )
 
 
 def insert_scouted_product(name: str, niche: str, app_url: str):
     conn = get_conn()
-    c = conn.cursor()
-    now = datetime.utcnow().isoformat()
-    c.execute(
-        """
-        INSERT OR IGNORE INTO posts (name, niche, link, status, app_url, image_url, created_at)
-        VALUES (?, ?, '', 'Pending', ?, '', ?)
-        """,
-        (name, niche, app_url, now),
-    )
-    conn.commit()
-    conn.close()
+    with conn:
+        c = conn.cursor()
+        now = datetime.utcnow().isoformat()
+        c.execute(
+            """
+            INSERT OR IGNORE INTO posts (name, niche, link, status, app_url, image_url, created_at)
+            VALUES (?, ?, '', 'Pending', ?, '', ?)
+            """,
+            (name, niche, app_url, now),
+        )
 
 
-def get_ready_item():
-    conn = get_conn()
-    c = conn.cursor()
-    c.execute(
-        "SELECT id, name, niche, link, status, app_url FROM posts "
-        "WHERE status = 'Ready' LIMIT 1"
-    )
-    row = c.fetchone()
-    conn.close()
-    return row
+def get_ready_item(lease_sec: int = CLAIM_LEASE_SEC):
+    """Atomically claim the highest-priority Ready post for this worker.
+
+    The post moves to 'Claimed' until the pipeline sets its final status
+    (see empire_job_queue).
+    """
+    return claim_job(get_conn(), "id, name, niche, link, status, app_url", lease_sec)
 
 
 def get_pending_count():
@@ -268,34 +479,134 @@ def get_pending_count():
     c = conn.cursor()
     c.execute("SELECT COUNT(*) FROM posts WHERE status = 'Pending'")
     count = c.fetchone()[0]
-    conn.close()
     return count
 
 
 # -----------------------------------------
 # ERROR LOGGING
 # -----------------------------------------
+ERROR_FLUSH_ROWS = 50
+ERROR_FLUSH_MS = 500
+ERROR_DEDUPE_SEC = 60
+_SINK_STOP = object()
+
+
+class ErrorSink:
+    """Writes error_log rows from a background thread in batched commits.
+
+    A batch is committed after ERROR_FLUSH_ROWS errors or ERROR_FLUSH_MS,
+    whichever comes first. Identical (item, stage, message) errors are folded
+    into one row and counted in its occurrences column; for ERROR_DEDUPE_SEC
+    after a row is opened later batches add to it, then a new row starts (as
+    it does at midnight UTC), so no row spans more than that window or one
+    day. Pending rows are flushed at interpreter exit.
+    """
+
+    def __init__(self, flush_rows=ERROR_FLUSH_ROWS, flush_ms=ERROR_FLUSH_MS,
+                 dedupe_sec=ERROR_DEDUPE_SEC):
+        self.flush_rows = flush_rows
+        self.flush_sec = flush_ms / 1000
+        self.dedupe_sec = dedupe_sec
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._recent = {}  # key -> (error_log id, monotonic time it was opened, UTC day)
+
+    def put(self, item_name, stage, message):
+        if self._thread is None:
+            self._start()
+        self._queue.put((item_name, stage, message, datetime.utcnow()))
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="error-sink", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+
+    def close(self, timeout=5):
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(_SINK_STOP)
+            thread.join(timeout)
+
+    def _run(self):
+        pending = {}  # key -> [first_seen, last_seen, count]
+        received = 0
+        deadline = 0.0
+        stop = False
+        while not stop:
+            timeout = max(0.0, deadline - time.monotonic()) if pending else None
+            try:
+                entry = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                entry = None
+            if entry is _SINK_STOP:
+                stop = True
+            elif entry is not None:
+                item_name, stage, message, at = entry
+                seen = pending.get((item_name, stage, message))
+                if seen is None:
+                    if not pending:
+                        deadline = time.monotonic() + self.flush_sec
+                    pending[(item_name, stage, message)] = [at, at, 1]
+                else:
+                    seen[1] = at
+                    seen[2] += 1
+                received += 1
+            if pending and (stop or received >= self.flush_rows or time.monotonic() >= deadline):
+                self._flush(pending)
+                pending = {}
+                received = 0
+
+    def _flush(self, pending):
+        now = time.monotonic()
+        written = {}
+        conn = get_conn()
+        try:
+            for key, (first, last, count) in pending.items():
+                recent = self._recent.get(key)
+                if (
+                    recent is not None
+                    and now - recent[1] < self.dedupe_sec
+                    and recent[2] == last.date()
+                ):
+                    cur = conn.execute(
+                        "UPDATE error_log SET occurrences = occurrences + ?, last_seen_at = ? "
+                        "WHERE id = ?",
+                        (count, last.isoformat(), recent[0]),
+                    )
+                    if cur.rowcount:
+                        continue
+                cur = conn.execute(
+                    """
+                    INSERT INTO error_log
+                        (item_name, stage, message, created_at, created_day, occurrences, last_seen_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (*key, first.isoformat(), first.date().isoformat(), count, last.isoformat()),
+                )
+                written[key] = (cur.lastrowid, now, first.date())
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            logging.error("Failed to write to error_log: %s", e)
+            return
+        self._recent.update(written)
+        self._recent = {k: v for k, v in self._recent.items() if now - v[1] < self.dedupe_sec}
+
+
+error_sink = ErrorSink()
+
+
 def log_error(item_name: str, stage: str, message: str):
     message_short = (message or "").strip()
     if len(message_short) > 600:
         message_short = message_short[:600] + "...[truncated]"
 
     logging.error("Error [%s] %s: %s", stage, item_name, message_short)
-
-    try:
-        conn = get_conn()
-        c = conn.cursor()
-        c.execute(
-            """
-            INSERT INTO error_log (item_name, stage, message, created_at)
-            VALUES (?, ?, ?, ?)
-            """,
-            (item_name, stage, message_short, datetime.utcnow().isoformat()),
-        )
-        conn.commit()
-        conn.close()
-    except Exception as e:
-        logging.error("Failed to write to error_log: %s", e)
+    error_sink.put(item_name, stage, message_short)
 
 
 # -----------------------------------------
@@ -343,6 +654,141 @@ def safe_get(url, headers=None, timeout=30, item_name="SYSTEM", stage="network")
         return None
 
 
+# -----------------------------------------
+# TOKEN / COST METER
+# -----------------------------------------
+TOKEN_WINDOW_SEC = 3600
+TOKEN_BUCKET_SEC = 60
+
+# USD per 1K (prompt, completion) tokens
+MODEL_PRICES = {
+    "gpt-4o": (0.0025, 0.01),
+    "llama-3.1-sonar-large-128k-online": (0.001, 0.001),
+}
+# USD per unit for APIs that do not report tokens
+UNIT_PRICES = {
+    "dall-e-3": 0.04,  # per 1024x1024 image
+    "tts-1": 0.015 / 1000,  # per input character
+}
+
+
+class TokenMeter:
+    """Rolling one-hour window of API token usage and estimated spend.
+
+    Publishes SYSTEM.TOKEN_PRESSURE_HIGH when either rate crosses its limit
+    (settings token_limit_hour / cost_limit_hour) and SYSTEM.TOKEN_PRESSURE_NORMAL
+    once both fall back below token_pressure_release of the limit.
+    """
+
+    def __init__(self, window_sec=TOKEN_WINDOW_SEC, bucket_sec=TOKEN_BUCKET_SEC):
+        self.window_sec = window_sec
+        self.bucket_sec = bucket_sec
+        self.state = "NORMAL"
+        self._buckets = deque()  # [bucket_start, tokens, cost]
+        self._lock = threading.Lock()
+
+    def _trim(self, now):
+        while self._buckets and self._buckets[0][0] <= now - self.window_sec:
+            self._buckets.popleft()
+
+    def record(self, stage, model, tokens=0, cost=0.0):
+        now = time.time()
+        start = now - now % self.bucket_sec
+        with self._lock:
+            if not self._buckets or self._buckets[-1][0] != start:
+                self._buckets.append([start, 0, 0.0])
+            self._buckets[-1][1] += tokens
+            self._buckets[-1][2] += cost
+            self._trim(now)
+        logging.info("Usage [%s] %s: %d tokens, $%.4f", stage, model, tokens, cost)
+        self.check()
+
+    def record_response(self, stage, model, resp):
+        """Record the ``usage`` block of a chat completion response."""
+        try:
+            usage = resp.json().get("usage") or {}
+        except Exception:
+            return
+        prompt = int(usage.get("prompt_tokens", 0))
+        completion = int(usage.get("completion_tokens", 0))
+        total = int(usage.get("total_tokens", prompt + completion))
+        in_price, out_price = MODEL_PRICES.get(model, (0.0, 0.0))
+        cost = (prompt * in_price + completion * out_price) / 1000
+        self.record(stage, model, total, cost)
+
+    def record_units(self, stage, model, units):
+        self.record(stage, model, 0, units * UNIT_PRICES.get(model, 0.0))
+
+    def rates(self):
+        """(tokens per hour, USD per hour) over the window."""
+        with self._lock:
+            self._trim(time.time())
+            tokens = sum(b[1] for b in self._buckets)
+            cost = sum(b[2] for b in self._buckets)
+        hours = self.window_sec / 3600
+        return tokens / hours, cost / hours
+
+    def check(self):
+        tokens, cost = self.rates()
+        try:
+            token_limit = float(get_setting("token_limit_hour", "250000"))
+            cost_limit = float(get_setting("cost_limit_hour", "5.00"))
+            release = float(get_setting("token_pressure_release", "0.8"))
+        except Exception as e:
+            log_error("SYSTEM", "token_meter", f"Threshold parse error: {e}")
+            return self.state
+
+        pressure = max(
+            tokens / token_limit if token_limit > 0 else 0.0,
+            cost / cost_limit if cost_limit > 0 else 0.0,
+        )
+        if self.state == "NORMAL" and pressure >= 1.0:
+            self._publish("HIGH", tokens, cost, pressure)
+        elif self.state == "HIGH" and pressure < release:
+            self._publish("NORMAL", tokens, cost, pressure)
+        return self.state
+
+    def _publish(self, state, tokens, cost, pressure):
+        self.state = state
+        logging.warning(
+            "Token pressure %s: %.0f tokens/h, $%.2f/h (%.0f%% of limit)",
+            state, tokens, cost, pressure * 100,
+        )
+        set_setting("token_pressure", state)
+        if event_bus is None:
+            return
+        try:
+            event_bus.publish(
+                f"SYSTEM.TOKEN_PRESSURE_{state}",
+                {
+                    "source": "engine",
+                    "tokens_per_hour": tokens,
+                    "cost_per_hour": cost,
+                    "pressure": pressure,
+                },
+            )
+        except Exception as e:
+            log_error("SYSTEM", "token_meter", f"Pressure publish failed: {e}")
+
+    def restore(self):
+        """Adopt the state a previous run persisted, then re-check it.
+
+        The window starts empty after a restart, so a HIGH left behind is
+        released here: NORMAL is published and persisted instead of the
+        setting staying stuck at HIGH.
+        """
+        persisted = get_setting("token_pressure", "NORMAL")
+        self.state = "HIGH" if persisted == "HIGH" else "NORMAL"
+        return self.check()
+
+    @property
+    def under_pressure(self):
+        return self.state == "HIGH"
+
+
+token_meter = TokenMeter()
+
+
 # -----------------------------------------
 # SYSTEM LOAD / RESOURCE GUARD
 # -----------------------------------------
@@ -384,6 +830,52 @@ def resource_guard():
     return "ok"
 
 
+# -----------------------------------------
+# OVERSEER HOOKS
+# -----------------------------------------
+scout_requests = queue.Queue()
+
+
+def _on_scout_requested(payload):
+    # A batch arrives as one event per slot; each slot is one scout run.
+    scout_requests.put(payload.get("niche") or "DTF Tools")
+
+
+def requested_scout_niches():
+    niches = []
+    while True:
+        try:
+            niches.append(scout_requests.get_nowait())
+        except queue.Empty:
+            return niches
+
+
+def heavy_job_slot():
+    """Slot in the Overseer's media gate; LIMIT_HEAVY_JOBS shrinks it."""
+    if media_concurrency is None:
+        return contextlib.nullcontext()
+    return media_concurrency
+
+
+def start_overseer():
+    if OverseerScheduler is None or event_bus is None:
+        logging.info("Overseer not installed; running without mode control.")
+        return None
+    event_bus.subscribe(SCOUT_JOB_TOPIC, _on_scout_requested)
+    controller = OverseerController(
+        signal_source=sqlite_signal_source(
+            DB_FILE,
+            daily_limit=int(load_secrets().get("daily_run_limit", 5)),
+            resource_guard=resource_guard,
+        )
+    )
+    scheduler = OverseerScheduler(controller=controller)
+    scheduler.start()
+    atexit.register(scheduler.stop)
+    logging.info("Overseer scheduler started.")
+    return scheduler
+
+
 # -----------------------------------------
 # SCOUTING / FACT CHECK / CONTENT
 # -----------------------------------------
@@ -424,6 +916,7 @@ def run_scout_real(niche: str, pplx_key: str):
     resp = safe_post(url, payload, headers, item_name="SYSTEM", stage="scout")
     if not resp:
         return []
+    token_meter.record_response("scout", payload["model"], resp)
 
     try:
         content = resp.json()["choices"][0]["message"]["content"]
@@ -465,6 +958,7 @@ def find_app_link_real(product: str, pplx_key: str):
     resp = safe_post(url, payload, headers, item_name=product, stage="affiliate_lookup")
     if not resp:
         return "https://google.com"
+    token_meter.record_response("affiliate_lookup", payload["model"], resp)
 
     try:
         link = resp.json()["choices"][0]["message"]["content"].strip()
@@ -507,6 +1001,7 @@ def get_product_facts(product: str, pplx_key: str):
     resp = safe_post(url, payload, headers, item_name=product, stage="fact_check")
     if not resp:
         return "General contractor tool overview."
+    token_meter.record_response("fact_check", payload["model"], resp)
 
     try:
         return resp.json()["choices"][0]["message"]["content"]
@@ -567,6 +1062,7 @@ def create_content(product: str, facts: str, openai_key: str):
     )
     if not resp:
         return None
+    token_meter.record_response("content", payload["model"], resp)
 
     try:
         return resp.json()["choices"][0]["message"]["content"]
@@ -605,6 +1101,7 @@ def produce_media(product: str, script: str, openai_key: str, base_dir: str):
         }
         resp = safe_post("https://api.openai.com/v1/images/generations", img_payload, h_oa, item_name=product, stage="media_image")
         if resp:
+            token_meter.record_units("media_image", img_payload["model"], 1)
             img_url = resp.json()["data"][0]["url"]
             # Download and save image locally
             r_img = safe_get(img_url, item_name=product, stage="media_image_dl")
@@ -631,6 +1128,7 @@ def produce_media(product: str, script: str, openai_key: str, base_dir: str):
             timeout=120,
         )
         if resp:
+            token_meter.record_units("media_audio", aud_payload["model"], len(script or ""))
             with open(aud_path, "wb") as f:
                 f.write(resp.content)
         else:
@@ -773,7 +1271,8 @@ def production_line(row: tuple, secrets: dict):
         os.makedirs(folder, exist_ok=True)
 
         # 3. MEDIA PRODUCTION
-        img_url, vid_path = produce_media(name, script, secrets.get("openai_key", ""), folder)
+        with heavy_job_slot():
+            img_url, vid_path = produce_media(name, script, secrets.get("openai_key", ""), folder)
 
         # 4. WORDPRESS PUBLISH
         smart_link = create_smart_link(secrets.get("wp_url", ""), name, link)
@@ -800,7 +1299,13 @@ def run_backup():
     os.makedirs(d, exist_ok=True)
     try:
         if os.path.exists(DB_FILE):
-            shutil.copy2(DB_FILE, os.path.join(d, "empire.db"))
+            # WAL mode keeps recent commits outside the main file; the backup
+            # API copies a consistent snapshot including them.
+            dest = sqlite3.connect(os.path.join(d, "empire.db"))
+            try:
+                get_conn().backup(dest)
+            finally:
+                dest.close()
         if os.path.exists(SECRETS_PATH):
             os.makedirs(os.path.join(d, ".streamlit"), exist_ok=True)
             shutil.copy2(SECRETS_PATH, os.path.join(d, ".streamlit", "secrets.toml"))
@@ -812,6 +1317,8 @@ def run_backup():
 def autopilot_loop():
     logging.info("=== DTF COMMAND ENGINE V52 ONLINE ===")
     init_db()
+    token_meter.restore()
+    overseer = start_overseer()
     run_backup() # Run a backup at startup
     backoff = 30 # Initial sleep for network errors
 
@@ -838,10 +1345,14 @@ def autopilot_loop():
             if state == "pause":
                 time.sleep(60)
                 continue
-            elif state == "throttle":
+            elif state == "throttle" or token_meter.check() == "HIGH":
                 delay = 60 # Slower production loop
             else:
                 delay = 10 # Normal production loop
+            if overseer is not None and overseer.heavy_jobs_limited:
+                # COOLDOWN: items are produced one at a time, so a smaller
+                # media gate changes nothing; space the items out instead.
+                delay = max(delay, int(get_setting("cooldown_delay", "300")))
 
             # 3. Budget Check
             if not check_budget(limit):
@@ -857,14 +1368,26 @@ def autopilot_loop():
                 backoff = 30 # Reset backoff after success
                 continue
 
-            # 5. Scout Check (No Ready items, check Pending count)
+            # 5. Scout Check (No Ready items, check Pending count, or an
+            # Overseer content batch while the Pending backlog is small)
             pending = get_pending_count()
-            if pending == 0:
-                logging.info("Pipeline empty. Scouting for new tools.")
-                items = run_scout_real("DTF Tools", pplx_key)
-                for it in items:
-                    app = find_app_link_real(it, pplx_key)
-                    insert_scouted_product(it, "DTF Tools", app)
+            requested = requested_scout_niches()
+            pending_cap = int(get_setting("scout_pending_cap", "10"))
+            if requested and pending >= pending_cap:
+                requested = []
+            if pending == 0 or requested:
+                logging.info(
+                    "Scouting for new tools: %s",
+                    f"{len(requested)} requested runs" if requested else "pipeline empty",
+                )
+                for niche in requested or ["DTF Tools"]:
+                    items = run_scout_real(niche, pplx_key)
+                    for it in items:
+                        app = find_app_link_real(it, pplx_key)
+                        insert_scouted_product(it, niche, app)
+                    # Stop the batch early once the Pending backlog is full.
+                    if get_pending_count() >= pending_cap:
+                        break
                 time.sleep(60) # Short wait after scouting
                 continue
             
@@ -995,7 +1518,8 @@ def get_counts():
     c = conn.cursor()
     c.execute("SELECT COUNT(*) FROM posts WHERE status='Pending'")
     pending = c.fetchone()[0]
-    c.execute("SELECT COUNT(*) FROM posts WHERE status='Ready'")
+    # Claimed posts are in production; they still count as queued.
+    c.execute("SELECT COUNT(*) FROM posts WHERE status IN ('Ready','Claimed')")
     ready = c.fetchone()[0]
     c.execute("SELECT COUNT(*) FROM posts WHERE status='Published'")
     published = c.fetchone()[0]
@@ -1048,11 +1572,23 @@ def get_error_stats():
     conn = get_conn()
     c = conn.cursor()
     today = str(date.today())
-    c.execute("SELECT COUNT(*) FROM error_log WHERE created_at LIKE ?", (today+"%",))
-    today_errors = c.fetchone()[0]
-    c.execute("SELECT COUNT(*) FROM error_log")
-    total_errors = c.fetchone()[0]
-    c.execute("SELECT created_at FROM error_log ORDER BY id DESC LIMIT 1")
+    cols = {row[1] for row in c.execute("PRAGMA table_info(error_log)")}
+    # Repeated errors are folded into one row with an occurrences count; a
+    # row is bumped for a minute at most, so "last" goes by last_seen_at.
+    if "occurrences" in cols:
+        count, last_at = "SUM(COALESCE(occurrences, 1))", "COALESCE(last_seen_at, created_at)"
+    else:
+        count, last_at = "COUNT(*)", "created_at"
+    # created_day is indexed once the engine has migrated empire.db; a folded
+    # row never spans two days, so it is also the day of its last occurrence.
+    if "created_day" in cols:
+        c.execute(f"SELECT {count} FROM error_log WHERE created_day = ?", (today,))
+    else:
+        c.execute(f"SELECT {count} FROM error_log WHERE created_at LIKE ?", (today+"%",))
+    today_errors = c.fetchone()[0] or 0
+    c.execute(f"SELECT {count} FROM error_log")
+    total_errors = c.fetchone()[0] or 0
+    c.execute(f"SELECT MAX({last_at}) FROM error_log")
     row = c.fetchone()
     last = row[0] if row else None
     conn.close()
@@ -1260,7 +1796,7 @@ def page_pipeline():
     if df.empty:
         st.info("No items yet. Scout will populate soon.")
         return
-    status = st.selectbox("Filter Status",["(All)","Pending","Ready","Published","Failed"])
+    status = st.selectbox("Filter Status",["(All)","Pending","Ready","Claimed","Published","Failed"])
     search = st.text_input("Search Name")
     if status!="(All)": df = df[df["status"]==status]
     if search: df = df[df["name"].str.contains(search,case=False)]
@@ -1434,6 +1970,90 @@ wp_pass      = "your_wp_application_password"
 daily_run_limit = 5
 """
 
+# Leased job queue shared with the other engine editions (empire_job_queue.py).
+JOB_QUEUE_CODE = r'''"""Leased job queue over the ``posts`` table of empire.db.
+
+Shared by the engine editions (V52, V64 Apex, V61 UNITY, V68); each
+installer embeds a copy as ``JOB_QUEUE_CODE`` and writes it next to the
+``engine.py`` it installs, so keep those copies in step with this file.
+
+A worker claims the highest-priority ``Ready`` post, which moves it to
+``Claimed`` with a lease. Other workers cannot see it until the lease runs
+out (a crashed worker), after which it is handed out again, or marked
+``Failed`` once ``MAX_ATTEMPTS`` claims have been used up. Whatever final
+status the engine writes should also clear ``claimed_by``/``lease_until``.
+"""
+
+import os
+import socket
+import sqlite3
+import time
+
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+CLAIM_LEASE_SEC = 1800
+MAX_ATTEMPTS = 3
+
+CLAIM_COLUMNS = (
+    ("priority", "INTEGER DEFAULT 0"),
+    ("claimed_by", "TEXT"),
+    ("lease_until", "REAL"),
+    ("attempts", "INTEGER DEFAULT 0"),
+)
+
+# UPDATE ... RETURNING arrived in SQLite 3.35.
+HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35)
+
+
+def ensure_queue(conn):
+    """Add the claim columns and the (status, priority, id) index if missing."""
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(posts)")}
+    for column, decl in CLAIM_COLUMNS:
+        if column not in existing:
+            conn.execute(f"ALTER TABLE posts ADD COLUMN {column} {decl}")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_posts_queue ON posts (status, priority DESC, id)"
+    )
+
+
+def claim_job(conn, fields, lease_sec=CLAIM_LEASE_SEC, max_attempts=MAX_ATTEMPTS,
+              worker_id=WORKER_ID):
+    """Claim the next Ready post and return ``fields`` of it, or None.
+
+    Runs as one IMMEDIATE transaction, so concurrent workers never receive
+    the same post; both lookups walk idx_posts_queue instead of scanning.
+    """
+    now = time.time()
+    conn.execute("BEGIN IMMEDIATE")
+    with conn:
+        conn.execute(
+            "UPDATE posts SET status = CASE WHEN attempts >= ? THEN 'Failed' ELSE 'Ready' END, "
+            "claimed_by = NULL, lease_until = NULL "
+            "WHERE status = 'Claimed' AND lease_until < ?",
+            (max_attempts, now),
+        )
+        claim = (
+            "UPDATE posts SET status = 'Claimed', claimed_by = ?, lease_until = ?, "
+            "attempts = attempts + 1 WHERE id = {target}"
+        )
+        if HAS_RETURNING:
+            rows = conn.execute(
+                claim.format(
+                    target="(SELECT id FROM posts WHERE status = 'Ready' "
+                    "ORDER BY priority DESC, id LIMIT 1)"
+                ) + f" RETURNING {fields}",
+                (worker_id, now + lease_sec),
+            ).fetchall()
+            return rows[0] if rows else None
+
+        row = conn.execute(
+            "SELECT id FROM posts WHERE status = 'Ready' ORDER BY priority DESC, id LIMIT 1"
+        ).fetchone()
+        if row is None:
+            return None
+        conn.execute(claim.format(target="?"), (worker_id, now + lease_sec, row[0]))
+        return conn.execute(f"SELECT {fields} FROM posts WHERE id = ?", (row[0],)).fetchone()
+'''
+
 # =========================
 # IV. INSTALLER LOGIC
 # =========================
@@ -1457,6 +2077,7 @@ def install_empire_os():
 
     # 2. Write Files
     create(os.path.join(base_path, "engine.py"), ENGINE_CODE)
+    create(os.path.join(base_path, "empire_job_queue.py"), JOB_QUEUE_CODE)
     create(os.path.join(base_path, "dtf_command_hq.py"), DASH_CODE)
     create(os.path.join(base_path, "requirements.txt"), REQUIREMENTS)
     create(os.path.join(base_path, "launch.bat"), LAUNCH_BAT)
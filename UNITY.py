@@ -26,6 +26,7 @@ import base64
 import asyncio
 import requests
 import toml
+from empire_job_queue import claim_job, ensure_queue
 import feedparser
 from datetime import date, datetime
 
@@ -35,6 +36,7 @@ BRAND_URL = "https://www.design-to-finish.com"
 DB_FILE = "empire.db"
 SECRETS_PATH = os.path.join(".streamlit", "secrets.toml")
 LOG_FILE = os.path.join("logs", "empire_activity.log")
+
 os.makedirs("logs", exist_ok=True)
 os.makedirs("packets", exist_ok=True)
 
@@ -84,6 +86,12 @@ class DatabaseManager:
             conn.execute("CREATE TABLE IF NOT EXISTS run_log (id INTEGER PRIMARY KEY, run_date TEXT, item_name TEXT)")
             conn.execute("CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT)")
             conn.execute("INSERT OR IGNORE INTO settings (key,value) VALUES ('system_status', 'RUNNING')")
+            ensure_queue(conn)
+
+    def claim_job(self, fields):
+        """Leased claim of the next Ready post (shared empire_job_queue)."""
+        with self.get_conn() as conn:
+            return claim_job(conn, fields)
 
     def seed_data(self):
         # Pre-loading the SaaS list
@@ -273,8 +281,7 @@ async def pipeline_worker():
         pub_eng = Publisher(secrets)
         
         # Check Job
-        with db.get_conn() as conn:
-            job = conn.execute("SELECT id, name, link, app_url FROM posts WHERE status='Ready' LIMIT 1").fetchone()
+        job = db.claim_job("id, name, link, app_url")
         
         if job:
             _id, name, link, app_url = job
@@ -298,7 +305,7 @@ async def pipeline_worker():
                 
                 # 4. Finalize
                 with db.get_conn() as conn:
-                    conn.execute("UPDATE posts SET status='Published', image_url=?, video_path=?, social_json=?, price_intel=? WHERE id=?", 
+                    conn.execute("UPDATE posts SET status='Published', claimed_by=NULL, lease_until=NULL, image_url=?, video_path=?, social_json=?, price_intel=? WHERE id=?", 
                                  (str(img), str(vid), content_json, intel['price'], _id))
                     conn.commit()
                 logging.info(f"✅ Pipeline Complete: {name}")
@@ -306,7 +313,7 @@ async def pipeline_worker():
             except Exception as e:
                 logging.error(f"❌ Pipeline Break: {e}")
                 with db.get_conn() as conn:
-                    conn.execute("UPDATE posts SET status='Failed' WHERE id=?", (_id,))
+                    conn.execute("UPDATE posts SET status='Failed', claimed_by=NULL, lease_until=NULL WHERE id=?", (_id,))
                     conn.commit()
         
         time.sleep(60)
@@ -345,7 +352,7 @@ c2.success(f"Modules: {', '.join(features)}")
 
 # Metrics
 conn = get_conn()
-ready = conn.execute("SELECT COUNT(*) FROM posts WHERE status='Ready'").fetchone()[0]
+ready = conn.execute("SELECT COUNT(*) FROM posts WHERE status IN ('Ready','Claimed')").fetchone()[0]
 pub = conn.execute("SELECT COUNT(*) FROM posts WHERE status='Published'").fetchone()[0]
 conn.close()
 c3.metric("Queue", ready, f"{pub} Published")
@@ -0,0 +1,81 @@
+"""Leased job queue over the ``posts`` table of empire.db.
+
+Shared by the engine editions (V52, V64 Apex, V61 UNITY, V68); each
+installer embeds a copy as ``JOB_QUEUE_CODE`` and writes it next to the
+``engine.py`` it installs, so keep those copies in step with this file.
+
+A worker claims the highest-priority ``Ready`` post, which moves it to
+``Claimed`` with a lease. Other workers cannot see it until the lease runs
+out (a crashed worker), after which it is handed out again, or marked
+``Failed`` once ``MAX_ATTEMPTS`` claims have been used up. Whatever final
+status the engine writes should also clear ``claimed_by``/``lease_until``.
+"""
+
+import os
+import socket
+import sqlite3
+import time
+
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+CLAIM_LEASE_SEC = 1800
+MAX_ATTEMPTS = 3
+
+CLAIM_COLUMNS = (
+    ("priority", "INTEGER DEFAULT 0"),
+    ("claimed_by", "TEXT"),
+    ("lease_until", "REAL"),
+    ("attempts", "INTEGER DEFAULT 0"),
+)
+
+# UPDATE ... RETURNING arrived in SQLite 3.35.
+HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35)
+
+
+def ensure_queue(conn):
+    """Add the claim columns and the (status, priority, id) index if missing."""
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(posts)")}
+    for column, decl in CLAIM_COLUMNS:
+        if column not in existing:
+            conn.execute(f"ALTER TABLE posts ADD COLUMN {column} {decl}")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_posts_queue ON posts (status, priority DESC, id)"
+    )
+
+
+def claim_job(conn, fields, lease_sec=CLAIM_LEASE_SEC, max_attempts=MAX_ATTEMPTS,
+              worker_id=WORKER_ID):
+    """Claim the next Ready post and return ``fields`` of it, or None.
+
+    Runs as one IMMEDIATE transaction, so concurrent workers never receive
+    the same post; both lookups walk idx_posts_queue instead of scanning.
+    """
+    now = time.time()
+    conn.execute("BEGIN IMMEDIATE")
+    with conn:
+        conn.execute(
+            "UPDATE posts SET status = CASE WHEN attempts >= ? THEN 'Failed' ELSE 'Ready' END, "
+            "claimed_by = NULL, lease_until = NULL "
+            "WHERE status = 'Claimed' AND lease_until < ?",
+            (max_attempts, now),
+        )
+        claim = (
+            "UPDATE posts SET status = 'Claimed', claimed_by = ?, lease_until = ?, "
+            "attempts = attempts + 1 WHERE id = {target}"
+        )
+        if HAS_RETURNING:
+            rows = conn.execute(
+                claim.format(
+                    target="(SELECT id FROM posts WHERE status = 'Ready' "
+                    "ORDER BY priority DESC, id LIMIT 1)"
+                ) + f" RETURNING {fields}",
+                (worker_id, now + lease_sec),
+            ).fetchall()
+            return rows[0] if rows else None
+
+        row = conn.execute(
+            "SELECT id FROM posts WHERE status = 'Ready' ORDER BY priority DESC, id LIMIT 1"
+        ).fetchone()
+        if row is None:
+            return None
+        conn.execute(claim.format(target="?"), (worker_id, now + lease_sec, row[0]))
+        return conn.execute(f"SELECT {fields} FROM posts WHERE id = ?", (row[0],)).fetchone()
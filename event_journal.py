@@ -0,0 +1,161 @@
+"""Append-only event journal for the DTF_EMPIRE event bus.
+
+Events are buffered in memory and written to an ``event_journal`` table in
+batches by a background thread, so publishers never pay a commit per event.
+The database runs in WAL mode so the dashboard and ``replay`` can read while
+the engine keeps appending.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import sqlite3
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from threading import Event, Lock, Thread
+from typing import Any, Dict, Iterator, List, Mapping, Tuple
+
+
+@dataclass(frozen=True)
+class JournalRecord:
+    id: int
+    ts: float
+    event_type: str
+    payload: Dict[str, Any]
+
+
+def _encode_default(value: Any) -> Any:
+    # EventPayload instances (and anything else dict-like) journal as plain dicts.
+    to_dict = getattr(value, "to_dict", None)
+    if callable(to_dict):
+        return to_dict()
+    if isinstance(value, Mapping):
+        return dict(value)
+    return str(value)
+
+
+class EventJournal:
+    """SQLite-backed, batch-committed event log."""
+
+    def __init__(
+        self,
+        db_path: str = "empire.db",
+        table: str = "event_journal",
+        flush_every: int = 200,
+        flush_interval: float = 0.5,
+    ) -> None:
+        if not table.isidentifier():
+            raise ValueError(f"Invalid journal table name: {table}")
+        self.db_path = db_path
+        self.table = table
+        self.flush_every = max(1, flush_every)
+        self.flush_interval = flush_interval
+
+        self._buffer: List[Tuple[float, str, str]] = []
+        self._buffer_lock = Lock()
+        self._write_lock = Lock()
+        self._wake = Event()
+        self._stopped = False
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                id INTEGER PRIMARY KEY,
+                ts REAL NOT NULL,
+                event_type TEXT NOT NULL,
+                payload TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_ts ON {table}(ts)")
+        self._conn.commit()
+
+        self._flusher = Thread(target=self._flush_loop, name="event-journal", daemon=True)
+        self._flusher.start()
+        atexit.register(self.close)
+
+    def append(self, event_type: str, payload: Dict[str, Any]) -> None:
+        encoded = json.dumps(payload, default=_encode_default, separators=(",", ":"))
+        with self._buffer_lock:
+            self._buffer.append((time.time(), event_type, encoded))
+            full = len(self._buffer) >= self.flush_every
+        if full:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """Write all buffered events; returns how many were committed."""
+        with self._buffer_lock:
+            rows, self._buffer = self._buffer, []
+        if not rows:
+            return 0
+        with self._write_lock:
+            with self._conn:
+                self._conn.executemany(
+                    f"INSERT INTO {self.table} (ts, event_type, payload) VALUES (?, ?, ?)",
+                    rows,
+                )
+        return len(rows)
+
+    def _flush_loop(self) -> None:
+        while not self._stopped:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except sqlite3.Error as exc:
+                print(f"[EVENT_JOURNAL] Flush failed: {exc!r}")
+
+    def replay(
+        self,
+        since: float | datetime | None = None,
+        after_id: int | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[JournalRecord]:
+        """Yield journaled events in publish order.
+
+        ``since`` is a unix timestamp or datetime; ``after_id`` resumes from a
+        previously seen ``JournalRecord.id``. Pending buffered events are
+        flushed first so the replay includes everything appended so far.
+        """
+        self.flush()
+        if isinstance(since, datetime):
+            since = since.timestamp()
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            last_id = after_id or 0
+            while True:
+                if since is None:
+                    rows = conn.execute(
+                        f"SELECT id, ts, event_type, payload FROM {self.table} "
+                        "WHERE id > ? ORDER BY id LIMIT ?",
+                        (last_id, batch_size),
+                    ).fetchall()
+                else:
+                    rows = conn.execute(
+                        f"SELECT id, ts, event_type, payload FROM {self.table} "
+                        "WHERE id > ? AND ts >= ? ORDER BY id LIMIT ?",
+                        (last_id, since, batch_size),
+                    ).fetchall()
+                if not rows:
+                    return
+                for row_id, ts, event_type, payload in rows:
+                    yield JournalRecord(row_id, ts, event_type, json.loads(payload))
+                last_id = rows[-1][0]
+        finally:
+            conn.close()
+
+    def close(self) -> None:
+        if self._stopped:
+            return
+        self._stopped = True
+        self._wake.set()
+        self._flusher.join(timeout=5)
+        self.flush()
+        self._conn.close()
+        atexit.unregister(self.close)
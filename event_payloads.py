@@ -0,0 +1,74 @@
+"""Registered payload schemas for high-volume event bus topics.
+
+Importing this module registers each class with ``event_payload``; from then
+on a dict published on one of these topics is validated and converted once,
+and every subscriber receives the same frozen instance.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple
+
+from .event_bus import EventPayload, event_payload
+
+
+@event_payload("CONTENT.JOB_COMPLETED")
+@dataclass(frozen=True, slots=True)
+class JobCompleted(EventPayload):
+    latency_sec: float = 0.0
+    job_id: Optional[Any] = None
+    item_id: Optional[Any] = None
+    platform: Optional[str] = None
+
+
+@event_payload("CONTENT.JOB_FAILED")
+@dataclass(frozen=True, slots=True)
+class JobFailed(EventPayload):
+    error_message: str = "unknown"
+    latency_sec: float = 0.0
+    job_id: Optional[Any] = None
+    item_id: Optional[Any] = None
+    platform: Optional[str] = None
+
+
+@event_payload("CONTENT.SUPERVISOR_ALERT")
+@dataclass(frozen=True, slots=True)
+class SupervisorAlert(EventPayload):
+    source: str
+    jobs_failed: int = 0
+    last_error: Optional[str] = None
+
+
+@event_payload("MEDIA.OPTIMIZED")
+@dataclass(frozen=True, slots=True)
+class MediaOptimized(EventPayload):
+    size_kb: float = 0.0
+    asset_id: Optional[Any] = None
+    path: Optional[str] = None
+
+
+@event_payload("MEDIA.FAILED")
+@dataclass(frozen=True, slots=True)
+class MediaFailed(EventPayload):
+    error_message: str = "unknown"
+    asset_id: Optional[Any] = None
+    path: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class SupervisorReport(EventPayload):
+    """One supervisor's entry in ``OverseerStatusUpdated``; ``metrics`` is read-only."""
+
+    name: str
+    status: str
+    summary: str = ""
+    metrics: Mapping[str, float] = field(default_factory=lambda: MappingProxyType({}))
+
+
+@event_payload("OVERSEER.STATUS_UPDATED")
+@dataclass(frozen=True, slots=True)
+class OverseerStatusUpdated(EventPayload):
+    mode: str
+    supervisors: Tuple[SupervisorReport, ...] = ()
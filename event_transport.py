@@ -0,0 +1,269 @@
+"""Cross-process fan-out of event bus traffic over a Unix domain socket.
+
+The engine runs a ``UnixSocketEventServer`` next to its ``event_bus``; other
+processes (the Streamlit dashboard) connect with ``UnixSocketEventClient``,
+name the topic patterns they care about, and either re-publish the events on
+their own local bus or ``drain()`` them on each rerun to refresh incrementally
+instead of re-scanning ``empire.db``.
+
+Wire format is one JSON object per line: ``{"t": event_type, "ts": unix_ts,
+"p": payload}``. The first line a client sends is ``{"subscribe": [...]}``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import time
+from collections import deque
+from queue import Full, Queue
+from threading import Event, Lock, Thread
+from typing import Any, Deque, Dict, List, Sequence, Tuple
+
+from .event_bus import EventBus, Payload, event_bus, topic_matches
+from .event_journal import _encode_default
+
+
+DEFAULT_SOCKET_PATH = "empire_events.sock"
+
+
+def _require_unix_sockets() -> None:
+    if not hasattr(socket, "AF_UNIX"):
+        raise RuntimeError("Unix domain sockets are not available on this platform")
+
+
+class _ClientConnection:
+    """Server-side view of one connected process."""
+
+    def __init__(self, sock: socket.socket, patterns: Sequence[str], max_pending: int) -> None:
+        self.sock = sock
+        self.patterns = tuple(patterns)
+        self.outbox: Queue[bytes | None] = Queue(maxsize=max_pending)
+        self.alive = True
+
+    def wants(self, event_type: str) -> bool:
+        return any(topic_matches(p, event_type) for p in self.patterns)
+
+    def send_loop(self) -> None:
+        try:
+            while self.alive:
+                line = self.outbox.get()
+                if line is None:
+                    break
+                self.sock.sendall(line)
+        except OSError:
+            pass
+        finally:
+            self.alive = False
+            self.sock.close()
+
+
+class UnixSocketEventServer:
+    """Mirrors every event published on ``bus`` to connected clients.
+
+    Each client has its own bounded outbox and sender thread, so a slow or
+    stuck reader is disconnected rather than stalling the publisher.
+    """
+
+    def __init__(
+        self,
+        bus: EventBus = event_bus,
+        path: str = DEFAULT_SOCKET_PATH,
+        max_pending: int = 10000,
+    ) -> None:
+        _require_unix_sockets()
+        self.bus = bus
+        self.path = path
+        self.max_pending = max_pending
+        self._clients: List[_ClientConnection] = []
+        self._clients_lock = Lock()
+        self._listener: socket.socket | None = None
+        self._running = False
+
+    def start(self) -> None:
+        if self._running:
+            return
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(self.path)
+        listener.listen()
+        self._listener = listener
+        self._running = True
+
+        self.bus.subscribe("*", self._broadcast)
+        Thread(target=self._accept_loop, name="event-transport-accept", daemon=True).start()
+
+    def _accept_loop(self) -> None:
+        assert self._listener is not None
+        while self._running:
+            try:
+                sock, _ = self._listener.accept()
+            except OSError:
+                return
+            Thread(target=self._handshake, args=(sock,), daemon=True).start()
+
+    def _handshake(self, sock: socket.socket) -> None:
+        patterns: List[str] = ["*"]
+        try:
+            sock.settimeout(5.0)
+            hello = sock.makefile("rb").readline()
+            sock.settimeout(None)
+            if hello:
+                patterns = list(json.loads(hello).get("subscribe") or ["*"])
+        except (OSError, ValueError):
+            sock.close()
+            return
+
+        client = _ClientConnection(sock, patterns, self.max_pending)
+        with self._clients_lock:
+            self._clients.append(client)
+        client.send_loop()
+        with self._clients_lock:
+            if client in self._clients:
+                self._clients.remove(client)
+
+    def _broadcast(self, payload: Payload) -> None:
+        # Subscribed to "*": recover the topic from the bus dispatch context.
+        event_type = self.bus.current_event_type()
+        if event_type is None:
+            return
+
+        line: bytes | None = None
+        with self._clients_lock:
+            clients = list(self._clients)
+        for client in clients:
+            if not client.alive or not client.wants(event_type):
+                continue
+            if line is None:
+                line = (
+                    json.dumps(
+                        {"t": event_type, "ts": time.time(), "p": payload},
+                        default=_encode_default,
+                        separators=(",", ":"),
+                    )
+                    + "\n"
+                ).encode("utf-8")
+            try:
+                client.outbox.put_nowait(line)
+            except Full:
+                print(f"[EVENT_TRANSPORT] Dropping slow client ({len(client.patterns)} patterns)")
+                client.alive = False
+                client.sock.close()
+
+    def client_count(self) -> int:
+        with self._clients_lock:
+            return sum(1 for c in self._clients if c.alive)
+
+    def stop(self) -> None:
+        if not self._running:
+            return
+        self._running = False
+        self.bus.unsubscribe("*", self._broadcast)
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+        with self._clients_lock:
+            clients, self._clients = self._clients, []
+        for client in clients:
+            client.alive = False
+            try:
+                client.outbox.put_nowait(None)
+            except Full:
+                client.sock.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+
+class UnixSocketEventClient:
+    """Receives events from a ``UnixSocketEventServer`` in another process.
+
+    With ``bus`` set, received events are re-published on that local bus.
+    Otherwise they accumulate (bounded, oldest dropped) until ``drain()`` -
+    the shape a Streamlit rerun wants. The reader reconnects with backoff if
+    the engine restarts.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_SOCKET_PATH,
+        patterns: Sequence[str] = ("*",),
+        bus: EventBus | None = None,
+        max_buffer: int = 10000,
+    ) -> None:
+        _require_unix_sockets()
+        self.path = path
+        self.patterns = list(patterns)
+        self.bus = bus
+        self._buffer: Deque[Tuple[str, float, Dict[str, Any]]] = deque(maxlen=max_buffer)
+        self._buffer_lock = Lock()
+        self._stop = Event()
+        self._sock: socket.socket | None = None
+        self._thread: Thread | None = None
+        self.connected = False
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = Thread(target=self._read_loop, name="event-transport-client", daemon=True)
+        self._thread.start()
+
+    def _connect(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(self.path)
+        hello = json.dumps({"subscribe": self.patterns}) + "\n"
+        sock.sendall(hello.encode("utf-8"))
+        return sock
+
+    def _read_loop(self) -> None:
+        backoff = 0.5
+        while not self._stop.is_set():
+            try:
+                self._sock = self._connect()
+            except OSError:
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, 10.0)
+                continue
+
+            self.connected = True
+            backoff = 0.5
+            try:
+                for raw in self._sock.makefile("rb"):
+                    self._deliver(json.loads(raw))
+            except (OSError, ValueError):
+                pass
+            finally:
+                self.connected = False
+                self._sock.close()
+
+    def _deliver(self, message: Dict[str, Any]) -> None:
+        event_type = message.get("t", "")
+        payload = message.get("p") or {}
+        if self.bus is not None:
+            self.bus.publish(event_type, payload)
+            return
+        with self._buffer_lock:
+            self._buffer.append((event_type, float(message.get("ts", 0.0)), payload))
+
+    def drain(self, max_items: int | None = None) -> List[Tuple[str, float, Dict[str, Any]]]:
+        """Return (and forget) events received since the last drain."""
+        with self._buffer_lock:
+            if max_items is None or max_items >= len(self._buffer):
+                items = list(self._buffer)
+                self._buffer.clear()
+            else:
+                items = [self._buffer.popleft() for _ in range(max_items)]
+        return items
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._sock is not None:
+            try:
+                self._sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
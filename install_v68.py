@@ -26,6 +26,7 @@ import base64
 import asyncio
 import requests
 import toml
+from empire_job_queue import claim_job, ensure_queue
 # import feedparser # Optional: removing to reduce dependency errors if not needed immediately
 from datetime import date, datetime
 
@@ -64,11 +65,17 @@ class DatabaseManager:
                 fail_count INTEGER DEFAULT 0, created_at TEXT
             )""")
             conn.execute("CREATE TABLE IF NOT EXISTS run_log (id INTEGER PRIMARY KEY, run_date TEXT, item_name TEXT)")
+            ensure_queue(conn)
+
+    def claim_job(self, fields):
+        """Leased claim of the next Ready post (shared empire_job_queue)."""
+        with self.get_conn() as conn:
+            return claim_job(conn, fields)
 
     def fail_item(self, _id, count):
         status = "Pending" if count < 3 else "Failed" # Retry 3 times then kill
         with self.get_conn() as conn:
-            conn.execute("UPDATE posts SET status=?, fail_count=? WHERE id=?", (status, count + 1, _id))
+            conn.execute("UPDATE posts SET status=?, fail_count=?, claimed_by=NULL, lease_until=NULL WHERE id=?", (status, count + 1, _id))
 
 # --- CONTENT FACTORY ---
 class ContentFactory:
@@ -180,8 +187,7 @@ def pipeline_worker():
         factory = ContentFactory(secrets)
         pub_eng = Publisher(secrets)
         
-        with db.get_conn() as conn:
-            job = conn.execute("SELECT id, name, link, fail_count FROM posts WHERE status='Ready' LIMIT 1").fetchone()
+        job = db.claim_job("id, name, link, fail_count")
         
         if job:
             _id, name, link, fail_count = job
@@ -201,7 +207,7 @@ def pipeline_worker():
                 
                 if success:
                     with db.get_conn() as conn:
-                        conn.execute("UPDATE posts SET status='Published', image_url=?, video_path=? WHERE id=?", (str(img), str(vid), _id))
+                        conn.execute("UPDATE posts SET status='Published', claimed_by=NULL, lease_until=NULL, image_url=?, video_path=? WHERE id=?", (str(img), str(vid), _id))
                     logging.info(f"✅ SUCCESS: {name}")
                 else:
                     raise Exception("WordPress Upload Failed")
@@ -267,7 +273,7 @@ with st.sidebar:
 try:
     conn = get_db()
     pending = conn.execute("SELECT COUNT(*) FROM posts WHERE status='Pending'").fetchone()[0]
-    ready = conn.execute("SELECT COUNT(*) FROM posts WHERE status='Ready'").fetchone()[0]
+    ready = conn.execute("SELECT COUNT(*) FROM posts WHERE status IN ('Ready','Claimed')").fetchone()[0]
     published = conn.execute("SELECT COUNT(*) FROM posts WHERE status='Published'").fetchone()[0]
     conn.close()
 except: pending, ready, published = 0, 0, 0
@@ -360,6 +366,90 @@ GOTO END
 """
 
 # --- INSTALLER LOGIC ---
+# Leased job queue shared with the other engine editions (empire_job_queue.py).
+JOB_QUEUE_CODE = r'''"""Leased job queue over the ``posts`` table of empire.db.
+
+Shared by the engine editions (V52, V64 Apex, V61 UNITY, V68); each
+installer embeds a copy as ``JOB_QUEUE_CODE`` and writes it next to the
+``engine.py`` it installs, so keep those copies in step with this file.
+
+A worker claims the highest-priority ``Ready`` post, which moves it to
+``Claimed`` with a lease. Other workers cannot see it until the lease runs
+out (a crashed worker), after which it is handed out again, or marked
+``Failed`` once ``MAX_ATTEMPTS`` claims have been used up. Whatever final
+status the engine writes should also clear ``claimed_by``/``lease_until``.
+"""
+
+import os
+import socket
+import sqlite3
+import time
+
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+CLAIM_LEASE_SEC = 1800
+MAX_ATTEMPTS = 3
+
+CLAIM_COLUMNS = (
+    ("priority", "INTEGER DEFAULT 0"),
+    ("claimed_by", "TEXT"),
+    ("lease_until", "REAL"),
+    ("attempts", "INTEGER DEFAULT 0"),
+)
+
+# UPDATE ... RETURNING arrived in SQLite 3.35.
+HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35)
+
+
+def ensure_queue(conn):
+    """Add the claim columns and the (status, priority, id) index if missing."""
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(posts)")}
+    for column, decl in CLAIM_COLUMNS:
+        if column not in existing:
+            conn.execute(f"ALTER TABLE posts ADD COLUMN {column} {decl}")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_posts_queue ON posts (status, priority DESC, id)"
+    )
+
+
+def claim_job(conn, fields, lease_sec=CLAIM_LEASE_SEC, max_attempts=MAX_ATTEMPTS,
+              worker_id=WORKER_ID):
+    """Claim the next Ready post and return ``fields`` of it, or None.
+
+    Runs as one IMMEDIATE transaction, so concurrent workers never receive
+    the same post; both lookups walk idx_posts_queue instead of scanning.
+    """
+    now = time.time()
+    conn.execute("BEGIN IMMEDIATE")
+    with conn:
+        conn.execute(
+            "UPDATE posts SET status = CASE WHEN attempts >= ? THEN 'Failed' ELSE 'Ready' END, "
+            "claimed_by = NULL, lease_until = NULL "
+            "WHERE status = 'Claimed' AND lease_until < ?",
+            (max_attempts, now),
+        )
+        claim = (
+            "UPDATE posts SET status = 'Claimed', claimed_by = ?, lease_until = ?, "
+            "attempts = attempts + 1 WHERE id = {target}"
+        )
+        if HAS_RETURNING:
+            rows = conn.execute(
+                claim.format(
+                    target="(SELECT id FROM posts WHERE status = 'Ready' "
+                    "ORDER BY priority DESC, id LIMIT 1)"
+                ) + f" RETURNING {fields}",
+                (worker_id, now + lease_sec),
+            ).fetchall()
+            return rows[0] if rows else None
+
+        row = conn.execute(
+            "SELECT id FROM posts WHERE status = 'Ready' ORDER BY priority DESC, id LIMIT 1"
+        ).fetchone()
+        if row is None:
+            return None
+        conn.execute(claim.format(target="?"), (worker_id, now + lease_sec, row[0]))
+        return conn.execute(f"SELECT {fields} FROM posts WHERE id = ?", (row[0],)).fetchone()
+'''
+
 def create_file(name, content):
     with open(os.path.join("DTF_Command_HQ_V68", name), "w", encoding="utf-8") as f:
         f.write(content.strip())
@@ -369,6 +459,7 @@ def main():
     if not os.path.exists(base): os.makedirs(base)
     
     create_file("engine.py", ENGINE_CODE)
+    create_file("empire_job_queue.py", JOB_QUEUE_CODE)
     create_file("dashboard.py", DASHBOARD_CODE)
     create_file("requirements.txt", REQ_CODE)
     create_file("launch.bat", BAT_CODE)
@@ -2,15 +2,132 @@
 
 from __future__ import annotations
 
+import functools
+import inspect
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from numbers import Real
+from typing import Any, Callable, Dict, List
+
+from core_infrastructure.event_bus_interface.event_bus import Subscription, event_bus
+from .supervisor_metrics import MetricsStore
+
+# Delivery lag (publish -> handler start) above which a topic counts as stalled.
+DEFAULT_LAG_ALERT_SEC = 30.0
+
+
+class _TopicWatch:
+    """Watchdog bookkeeping for one subscribed topic."""
+
+    __slots__ = (
+        "topic", "stall_after", "lag_alert", "last_event", "last_lag", "events", "stalled"
+    )
+
+    def __init__(self, topic: str, stall_after: float | None, lag_alert: float) -> None:
+        self.topic = topic
+        self.stall_after = stall_after
+        self.lag_alert = lag_alert
+        self.last_event: float | None = None
+        self.last_lag = 0.0
+        self.events = 0
+        self.stalled: str | None = None
+
+
+def _watched(supervisor: "ModuleSupervisor", handler: Callable, watch: _TopicWatch) -> Callable:
+    """Wrap ``handler`` to record arrival time and lag before calling it.
+
+    Coroutine handlers get an ``async`` wrapper so AsyncEventBus still
+    awaits them. ``functools.wraps`` sets ``__wrapped__``, which the bus keys
+    on, so ``event_bus.unsubscribe(topic, self._on_x)`` still finds it.
+    """
+
+    def record() -> None:
+        now = time.monotonic()
+        published_at = event_bus.current_publish_time()
+        lag = max(0.0, now - published_at) if published_at is not None else 0.0
+        watch.last_event = now
+        watch.last_lag = lag
+        watch.events += 1
+        supervisor.metrics.observe("event_lag_sec", lag)
+
+    if inspect.iscoroutinefunction(handler):
+
+        @functools.wraps(handler)
+        async def watched(payload: Any) -> None:
+            record()
+            await handler(payload)
+
+    else:
+
+        @functools.wraps(handler)
+        def watched(payload: Any) -> None:
+            record()
+            handler(payload)
+
+    # Keep the wrapper attributable to its supervisor, like the bound method
+    # it replaces (bus stats by owner, lazy-registry forwarding).
+    watched.__self__ = supervisor  # type: ignore[attr-defined]
+    return watched
+
+
+class TrackedState(dict):
+    """``state`` dict that bumps its owner's version on every write.
+
+    Supervisors keep mutating ``self.state[...]`` as before; the aggregator
+    compares versions to tell which health snapshots need rebuilding.
+    """
+
+    __slots__ = ("version",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self.version += 1
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self.version += 1
+        return super().setdefault(key, default)
+
+    def pop(self, *args: Any) -> Any:
+        self.version += 1
+        return super().pop(*args)
+
+    def popitem(self) -> Any:
+        self.version += 1
+        return super().popitem()
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
 
 
 class ModuleSupervisor(ABC):
     def __init__(self, name: str) -> None:
         self.name = name
-        self.state: Dict[str, Any] = {}
+        self.state: Dict[str, Any] = TrackedState()
         self._initialized: bool = False
+        self.metrics = MetricsStore()
+        self._changes = 0
+        # This process's share of fleet-wide counters (see incr_counter).
+        self._local_counters: Dict[str, float] = {}
+        self._synced_counters: Dict[str, float] = {}
+        self._counters_dirty = False
+        self._watches: Dict[str, _TopicWatch] = {}
+        # Watchdog wrappers live as long as the supervisor, so ``weak=True``
+        # subscriptions follow the supervisor rather than the temporary.
+        self._watched_handlers: List[Callable] = []
 
     @abstractmethod
     def initialize(self) -> None:
@@ -27,12 +144,153 @@ class ModuleSupervisor(ABC):
     def mark_initialized(self) -> None:
         self._initialized = True
 
+    # -- watchdog ---------------------------------------------------------
+
+    def subscribe(
+        self,
+        topic: str,
+        handler: Callable[[Any], None],
+        *,
+        stall_after: float | None = None,
+        lag_alert: float = DEFAULT_LAG_ALERT_SEC,
+        **options: Any,
+    ) -> Subscription:
+        """``event_bus.subscribe`` with watchdog tracking for ``topic``.
+
+        Every delivery records its arrival time and lag behind publish. Once
+        the topic has seen an event, going ``stall_after`` seconds without
+        another (or a delivery lagging more than ``lag_alert``) marks it
+        stalled; see ``check_watchdog``.
+        """
+        watch = self._watches.get(topic)
+        if watch is None:
+            watch = self._watches[topic] = _TopicWatch(topic, stall_after, lag_alert)
+        watched = _watched(self, handler, watch)
+        self._watched_handlers.append(watched)
+        return event_bus.subscribe(topic, watched, **options)
+
+    def check_watchdog(self, now: float | None = None) -> List[Dict[str, Any]]:
+        """Update stall flags; publish ``SYSTEM.SUPERVISOR_STALLED`` for new stalls.
+
+        Returns the stall events published by this call.
+        """
+        now = time.monotonic() if now is None else now
+        raised: List[Dict[str, Any]] = []
+        for watch in self._watches.values():
+            if watch.last_event is None:
+                continue  # never armed: an idle install is not a stall
+            idle = now - watch.last_event
+            reason = None
+            if watch.stall_after is not None and idle > watch.stall_after:
+                reason = "no_events"
+            elif watch.last_lag > watch.lag_alert:
+                reason = "lagging"
+
+            if reason == watch.stalled:
+                continue
+            watch.stalled = reason
+            self._changes += 1
+            if reason is None:
+                continue
+            event = {
+                "supervisor": self.name,
+                "topic": watch.topic,
+                "reason": reason,
+                "idle_sec": idle,
+                "lag_sec": watch.last_lag,
+            }
+            raised.append(event)
+            event_bus.publish("SYSTEM.SUPERVISOR_STALLED", event)
+        return raised
+
+    def health_snapshot(self) -> Dict[str, Any]:
+        """``get_health_snapshot()`` plus watchdog figures.
+
+        A stalled topic raises an ``ok``/``idle`` status to ``warning``.
+        """
+        snapshot = self.get_health_snapshot()
+        if not self._watches:
+            return snapshot
+
+        now = time.monotonic()
+        seen = [w for w in self._watches.values() if w.last_event is not None]
+        stalled = [w for w in self._watches.values() if w.stalled is not None]
+        snapshot = dict(snapshot)
+        if seen:
+            snapshot["seconds_since_last_event"] = min(now - w.last_event for w in seen)
+            snapshot["max_event_lag_sec"] = max(w.last_lag for w in seen)
+        snapshot["event_lag_p95_sec"] = self.metrics.quantile("event_lag_sec", 0.95, "1m")
+        snapshot["stalled_topics"] = len(stalled)
+        if stalled:
+            if snapshot.get("status") in ("ok", "idle"):
+                snapshot["status"] = "warning"
+            details = ", ".join(
+                f"{w.topic} ({'no events' if w.stalled == 'no_events' else 'lagging'})"
+                for w in stalled
+            )
+            snapshot["summary"] = f"Stalled: {details}. {snapshot.get('summary', '')}".strip()
+        return snapshot
+
     @property
     def initialized(self) -> bool:
         return self._initialized
 
+    def mark_changed(self) -> None:
+        """Flag the health snapshot as stale for changes made outside ``state``."""
+        self._changes += 1
+
+    @property
+    def version(self) -> int:
+        """Increases whenever anything feeding ``get_health_snapshot`` changes."""
+        state_version = getattr(self.state, "version", None)
+        if state_version is None:
+            # A subclass replaced ``state`` with a plain dict: never cache it.
+            self._changes += 1
+            return self._changes
+        return state_version + self._changes
+
     def record_metric(self, key: str, value: Any) -> None:
         self.state[key] = value
+        if isinstance(value, Real) and not isinstance(value, bool):
+            self.metrics.set_gauge(key, value)
+
+    def incr_counter(self, key: str, amount: float = 1) -> None:
+        """Increment a counter that is summed across worker processes.
+
+        ``state[key]`` is updated immediately; the state backend later
+        replaces it with the fleet-wide total.
+        """
+        self._local_counters[key] = self._local_counters.get(key, 0) + amount
+        self._counters_dirty = True
+        self.state[key] = self.state.get(key, 0) + amount
+
+    def take_counter_shard(self) -> Dict[str, float] | None:
+        """Local counter totals to publish, or ``None`` if unchanged since last time."""
+        if not self._counters_dirty:
+            return None
+        self._counters_dirty = False
+        self._synced_counters = dict(self._local_counters)
+        return self._synced_counters
+
+    def apply_fleet_counters(self, totals: Dict[str, float]) -> None:
+        """Fold fleet-wide counter sums into ``state``."""
+        for key, total in totals.items():
+            # Swap the shard we published for our live local value, so
+            # increments made since the last sync are not lost.
+            value = total - self._synced_counters.get(key, 0) + self._local_counters.get(key, 0)
+            current = self.state.get(key)
+            if isinstance(current, int) and float(value).is_integer():
+                value = int(value)
+            if current != value:
+                self.state[key] = value
+
+    def count_event(self, name: str, amount: float = 1.0) -> None:
+        self.metrics.incr(name, amount)
+        self._changes += 1
+
+    def observe_metric(self, name: str, value: float) -> None:
+        self.metrics.observe(name, value)
+        self._changes += 1
 
     def get_metric(self, key: str, default: Any = None) -> Any:
         return self.state.get(key, default)
@@ -0,0 +1,96 @@
+"""Benchmark: OverseerActionDecider over 1,000 supervisors x 200 rules.
+
+Run with ``python -m strategic_oversight.overseer_decider_bench``. Prints
+the cost of building the columnar view and of evaluating the rule table,
+and exits non-zero if a full decision does not fit in one Overseer tick.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from typing import List
+
+from strategic_oversight.overseer_action_decider import (
+    CompiledRuleSet,
+    Condition,
+    Rule,
+    SupervisorColumns,
+)
+from strategic_oversight.overseer_status_model import OverseerStatus, SupervisorHealth
+
+METRICS = ("failure_rate", "p95_latency_sec", "jobs_total", "link_failures", "avg_ctr")
+STATUSES = ("ok", "ok", "ok", "idle", "warning", "critical")
+OPS = (">", ">=", "<", "<=")
+
+
+def make_status(supervisors: int, rng: random.Random) -> OverseerStatus:
+    health: List[SupervisorHealth] = []
+    for i in range(supervisors):
+        metrics = {m: rng.random() * 100 for m in METRICS if rng.random() < 0.8}
+        health.append(
+            SupervisorHealth(f"sup_{i:04d}", rng.choice(STATUSES), "", metrics)
+        )
+    return OverseerStatus(mode="EXPANSION", supervisors=health)
+
+
+def make_rules(count: int, rng: random.Random) -> List[Rule]:
+    rules: List[Rule] = []
+    for i in range(count):
+        conditions = [
+            Condition(rng.choice(METRICS), rng.choice(OPS), round(rng.random() * 100, 1))
+            for _ in range(rng.randint(1, 3))
+        ]
+        if rng.random() < 0.3:
+            conditions.append(Condition("status", "in", ("warning", "critical")))
+        rules.append(
+            Rule(
+                f"ACTION_{i}",
+                when=tuple(conditions),
+                supervisors="sup_0*" if rng.random() < 0.2 else None,
+                min_matches=rng.randint(1, 5),
+            )
+        )
+    return rules
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--supervisors", type=int, default=1000)
+    parser.add_argument("--rules", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--tick-ms", type=float, default=250.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    status = make_status(args.supervisors, rng)
+    ruleset = CompiledRuleSet(make_rules(args.rules, rng))
+
+    view_times: List[float] = []
+    eval_times: List[float] = []
+    fired = 0
+    for _ in range(args.rounds):
+        start = time.perf_counter()
+        view = SupervisorColumns(status.supervisors)
+        built = time.perf_counter()
+        fired = len(ruleset.evaluate(status, view))
+        done = time.perf_counter()
+        view_times.append((built - start) * 1000)
+        eval_times.append((done - built) * 1000)
+
+    view_ms = sorted(view_times)[len(view_times) // 2]
+    eval_ms = sorted(eval_times)[len(eval_times) // 2]
+    total_ms = view_ms + eval_ms
+    print(
+        f"{args.supervisors} supervisors x {args.rules} rules: "
+        f"view {view_ms:.2f} ms + evaluate {eval_ms:.2f} ms = {total_ms:.2f} ms "
+        f"(median of {args.rounds}; {fired} actions; tick budget {args.tick_ms:.0f} ms)"
+    )
+    return 0 if total_ms <= args.tick_ms else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,242 @@
+"""Background scheduler that drives the Overseer and executes its actions.
+
+``OverseerController.step()`` only decides; this module runs it on a timer
+(thread or asyncio task) and routes each returned action to an executor
+registered for its ``type``. The default executors make the mode system
+control throughput: ``LIMIT_HEAVY_JOBS`` shrinks ``media_concurrency`` and
+``SCHEDULE_NEW_CONTENT_BATCH`` enqueues scout jobs on the event bus. The V52
+engine hosts the scheduler: it renders media inside ``media_concurrency``,
+spaces items out while ``heavy_jobs_limited`` (it produces one item at a
+time, so the gate alone would not slow it) and runs one scout per
+``SCOUT.JOB_REQUESTED`` event in its autopilot loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from threading import Condition, Event, Lock, Thread
+from typing import Any, Callable, Dict, List
+
+from core_infrastructure.event_bus_interface.event_bus import event_bus
+from .overseer_controller import OverseerController
+
+ActionExecutor = Callable[[Dict[str, Any]], None]
+
+SCOUT_JOB_TOPIC = "SCOUT.JOB_REQUESTED"
+
+
+class ConcurrencyGate:
+    """Semaphore whose limit can be changed while holders are active.
+
+    Shrinking never interrupts running work; new acquirers simply wait until
+    the number of holders drops below the new limit.
+    """
+
+    def __init__(self, limit: int) -> None:
+        if limit < 1:
+            raise ValueError("limit must be >= 1")
+        self._limit = limit
+        self._active = 0
+        self._cond = Condition(Lock())
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    def resize(self, limit: int) -> None:
+        if limit < 1:
+            raise ValueError("limit must be >= 1")
+        with self._cond:
+            self._limit = limit
+            self._cond.notify_all()
+
+    def acquire(self, timeout: float | None = None) -> bool:
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._active < self._limit, timeout):
+                return False
+            self._active += 1
+            return True
+
+    def release(self) -> None:
+        with self._cond:
+            self._active -= 1
+            self._cond.notify()
+
+    def __enter__(self) -> "ConcurrencyGate":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.release()
+
+
+# Media workers wrap each render in ``with media_concurrency:``.
+media_concurrency = ConcurrencyGate(limit=4)
+
+
+class OverseerScheduler:
+    """Runs ``controller.step()`` every ``interval`` seconds.
+
+    Executors run on the scheduler thread (or event loop) in action order; an
+    executor that raises is logged and does not stop the remaining actions.
+    Action types without an executor are left to ``OVERSEER.ACTION``
+    subscribers as before.
+    """
+
+    def __init__(
+        self,
+        controller: OverseerController | None = None,
+        interval: float = 5.0,
+        media_gate: ConcurrencyGate = media_concurrency,
+        heavy_job_limit: int = 1,
+        scout_batch_size: int = 5,
+        scout_niche: str = "DTF Tools",
+        min_batch_interval: float = 300.0,
+    ) -> None:
+        self.controller = controller or OverseerController()
+        self.interval = interval
+        self.media_gate = media_gate
+        self.normal_media_limit = media_gate.limit
+        self.heavy_job_limit = heavy_job_limit
+        self.scout_batch_size = scout_batch_size
+        self.scout_niche = scout_niche
+        self.min_batch_interval = min_batch_interval
+
+        self._executors: Dict[str, ActionExecutor] = {}
+        self._lock = Lock()
+        self._stop = Event()
+        self._thread: Thread | None = None
+        self._task: asyncio.Task | None = None
+        self._heavy_limited = False
+        self._last_batch_at = float("-inf")
+        self.ticks = 0
+        self.last_actions: List[Dict[str, Any]] = []
+
+        self.register("LIMIT_HEAVY_JOBS", self._limit_heavy_jobs)
+        self.register("SCHEDULE_NEW_CONTENT_BATCH", self._schedule_content_batch)
+
+    # -- executors --------------------------------------------------------
+
+    def register(self, action_type: str, executor: ActionExecutor) -> None:
+        with self._lock:
+            self._executors[action_type] = executor
+
+    def unregister(self, action_type: str) -> None:
+        with self._lock:
+            self._executors.pop(action_type, None)
+
+    def _limit_heavy_jobs(self, action: Dict[str, Any]) -> None:
+        if not self._heavy_limited:
+            self.normal_media_limit = self.media_gate.limit
+            self._heavy_limited = True
+        self.media_gate.resize(min(self.heavy_job_limit, self.normal_media_limit))
+
+    @property
+    def heavy_jobs_limited(self) -> bool:
+        """Whether the last tick asked for heavy jobs to be limited."""
+        return self._heavy_limited
+
+    def _restore_heavy_jobs(self) -> None:
+        if self._heavy_limited:
+            self._heavy_limited = False
+            self.media_gate.resize(self.normal_media_limit)
+
+    def _schedule_content_batch(self, action: Dict[str, Any]) -> None:
+        # EXPANSION emits this on every tick; enqueue at most one batch per
+        # ``min_batch_interval`` so a fast tick rate does not flood scouting.
+        now = time.monotonic()
+        if now - self._last_batch_at < self.min_batch_interval:
+            return
+        self._last_batch_at = now
+        niche = action.get("niche", self.scout_niche)
+        size = int(action.get("size", self.scout_batch_size))
+        event_bus.publish_many(
+            (SCOUT_JOB_TOPIC, {"niche": niche, "batch_index": i, "batch_size": size})
+            for i in range(size)
+        )
+
+    # -- ticking ----------------------------------------------------------
+
+    def tick(self) -> List[Dict[str, Any]]:
+        """Run one Overseer step and execute its actions."""
+        actions = self.controller.step()
+        self.ticks += 1
+        self.last_actions = actions
+
+        limited = False
+        for action in actions:
+            action_type = action.get("type", "")
+            limited = limited or action_type == "LIMIT_HEAVY_JOBS"
+            with self._lock:
+                executor = self._executors.get(action_type)
+            if executor is None:
+                continue
+            try:
+                executor(action)
+            except Exception as exc:
+                print(f"[OVERSEER_SCHEDULER] Executor for {action_type} failed: {exc!r}")
+
+        if not limited:
+            self._restore_heavy_jobs()
+        return actions
+
+    def _safe_tick(self) -> None:
+        try:
+            self.tick()
+        except Exception as exc:
+            print(f"[OVERSEER_SCHEDULER] Tick failed: {exc!r}")
+
+    def start(self) -> None:
+        """Tick on a daemon thread until ``stop()``."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name="overseer-scheduler", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        next_at = time.monotonic()
+        while not self._stop.is_set():
+            self._safe_tick()
+            next_at += self.interval
+            delay = next_at - time.monotonic()
+            if delay < 0:
+                # Fell behind (slow step); skip missed ticks instead of bursting.
+                next_at = time.monotonic()
+                delay = 0
+            self._stop.wait(delay)
+
+    def start_async(self) -> asyncio.Task:
+        """Tick from an asyncio task on the running loop until ``stop()``."""
+        if self._task is None or self._task.done():
+            self._stop.clear()
+            self._task = asyncio.get_running_loop().create_task(self._arun())
+        return self._task
+
+    async def _arun(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_at = loop.time()
+        while not self._stop.is_set():
+            # step() does SQLite and supervisor I/O; keep it off the loop.
+            await asyncio.to_thread(self._safe_tick)
+            next_at += self.interval
+            delay = next_at - loop.time()
+            if delay < 0:
+                next_at = loop.time()
+                delay = 0
+            await asyncio.sleep(delay)
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._restore_heavy_jobs()
@@ -0,0 +1,305 @@
+"""Fixed-size, memory-mapped ring of Overseer status snapshots.
+
+Each snapshot is one fixed-width binary record: a timestamp, the mode code
+and a float32 slot per column, where a column is ``"<supervisor>.<metric>"``
+(``"<supervisor>.status"`` holds the status code). Column names live in the
+file header, so a reader in another process (the dashboard) can mmap the
+file and chart hours of history without talking to the engine.
+
+File layout::
+
+    header   <8sIIIQ>  magic, capacity, max_columns, column_count, written
+    names    max_columns x 64 bytes, NUL padded UTF-8
+    records  capacity x (<dB3xI> + max_columns x <f>)
+
+``written`` counts records ever appended; the newest record sits at slot
+``(written - 1) % capacity``. NaN marks a column with no value in a record.
+Names longer than 64 bytes are cut on a character boundary, so names that
+share their first 64 bytes share a column.
+
+The ``I`` in each record head is a sequence stamp: the writer zeroes it,
+rewrites the record, then stamps it with the record's number. Readers check
+the stamp before and after copying a record and re-read the window when the
+writer has lapped them, so they never return a half-written record.
+"""
+
+from __future__ import annotations
+
+import math
+import mmap
+import os
+import struct
+import time
+from threading import Lock
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from .overseer_status_model import OverseerStatus
+
+MAGIC = b"OVSHIST2"
+_HEADER = struct.Struct("<8sIIIQ")
+_WRITTEN_OFFSET = 8 + 4 * 3
+_NAME_SIZE = 64
+_RECORD_HEAD = struct.Struct("<dB3xI")
+_SEQ = struct.Struct("<I")
+_SEQ_OFFSET = 12
+_READ_RETRIES = 3
+
+MODE_CODES: Dict[str, int] = {"EXPANSION": 0, "OPTIMIZATION": 1, "REMIX": 2, "COOLDOWN": 3}
+STATUS_CODES: Dict[str, int] = {"ok": 0, "idle": 1, "warning": 2, "critical": 3, "unknown": 4}
+MODE_NAMES = {code: name for name, code in MODE_CODES.items()}
+STATUS_NAMES = {code: name for name, code in STATUS_CODES.items()}
+
+
+def _seq(number: int) -> int:
+    """Sequence stamp of record ``number``; never 0, which marks a rewrite."""
+    return number % 0xFFFFFFFF + 1
+
+
+def _layout(capacity: int, max_columns: int) -> Tuple[int, int, int]:
+    names_offset = _HEADER.size
+    records_offset = names_offset + max_columns * _NAME_SIZE
+    record_size = _RECORD_HEAD.size + 4 * max_columns
+    return records_offset, record_size, records_offset + capacity * record_size
+
+
+class StatusHistoryRing:
+    """Writer side: appends ``OverseerStatus`` snapshots to the ring file.
+
+    Reopening an existing file keeps its history and column assignments;
+    ``capacity``/``max_columns`` are then taken from the file.
+    """
+
+    def __init__(self, path: str, capacity: int = 8640, max_columns: int = 256) -> None:
+        self.path = path
+        self._lock = Lock()
+
+        exists = os.path.exists(path) and os.path.getsize(path) >= _HEADER.size
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        if exists:
+            with open(path, "rb") as fh:
+                magic, capacity, max_columns, _, _ = _HEADER.unpack(fh.read(_HEADER.size))
+            if magic != MAGIC:
+                os.close(self._fd)
+                raise ValueError(f"{path} is not an Overseer status history file")
+
+        self.capacity = capacity
+        self.max_columns = max_columns
+        self._records_offset, self._record_size, size = _layout(capacity, max_columns)
+        if os.fstat(self._fd).st_size < size:
+            os.ftruncate(self._fd, size)
+        self._mm = mmap.mmap(self._fd, size)
+        self._record = struct.Struct(f"<dB3xI{max_columns}f")
+
+        if exists:
+            _, _, _, count, self._written = _HEADER.unpack_from(self._mm, 0)
+            self._columns = _read_names(self._mm, count)
+        else:
+            self._written = 0
+            self._columns = []
+            _HEADER.pack_into(self._mm, 0, MAGIC, capacity, max_columns, 0, 0)
+        self._index = {name: i for i, name in enumerate(self._columns)}
+        self._nan_row = [math.nan] * max_columns
+
+    def _column(self, name: str) -> int | None:
+        index = self._index.get(name)
+        if index is not None:
+            return index
+        # Key the column by the name as stored, so a long name maps to the
+        # same column readers (and a reopened writer) see.
+        stored = name.encode("utf-8")[:_NAME_SIZE].decode("utf-8", "ignore")
+        index = self._index.get(stored)
+        if index is None:
+            if len(self._columns) >= self.max_columns:
+                return None
+            index = len(self._columns)
+            offset = _HEADER.size + index * _NAME_SIZE
+            self._mm[offset:offset + _NAME_SIZE] = stored.encode("utf-8").ljust(_NAME_SIZE, b"\0")
+            self._columns.append(stored)
+            self._index[stored] = index
+            struct.pack_into("<I", self._mm, _WRITTEN_OFFSET - 4, len(self._columns))
+        self._index[name] = index
+        return index
+
+    def append(self, status: OverseerStatus, ts: float | None = None) -> None:
+        with self._lock:
+            row = list(self._nan_row)
+            for sup in status.supervisors:
+                index = self._column(f"{sup.name}.status")
+                if index is not None:
+                    row[index] = STATUS_CODES.get(sup.status, STATUS_CODES["unknown"])
+                for metric, value in sup.metrics.items():
+                    index = self._column(f"{sup.name}.{metric}")
+                    if index is not None:
+                        row[index] = float(value)
+
+            base = self._records_offset + (self._written % self.capacity) * self._record_size
+            # Zero the stamp first so readers treat the slot as in flux, and
+            # only stamp and publish the record once it is fully written.
+            _SEQ.pack_into(self._mm, base + _SEQ_OFFSET, 0)
+            self._record.pack_into(
+                self._mm,
+                base,
+                time.time() if ts is None else ts,
+                MODE_CODES.get(status.mode, 255),
+                0,
+                *row,
+            )
+            _SEQ.pack_into(self._mm, base + _SEQ_OFFSET, _seq(self._written))
+            self._written += 1
+            struct.pack_into("<Q", self._mm, _WRITTEN_OFFSET, self._written)
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns)
+
+    def __len__(self) -> int:
+        return min(self._written, self.capacity)
+
+    def flush(self) -> None:
+        self._mm.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._mm.closed:
+                return
+            self._mm.flush()
+            self._mm.close()
+            os.close(self._fd)
+
+
+def _read_names(buf: mmap.mmap, count: int) -> List[str]:
+    names = []
+    for i in range(count):
+        offset = _HEADER.size + i * _NAME_SIZE
+        names.append(bytes(buf[offset:offset + _NAME_SIZE]).rstrip(b"\0").decode("utf-8"))
+    return names
+
+
+class StatusHistoryReader:
+    """Read-only, memory-mapped view of a ring written by another process."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as fh:
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.capacity, self.max_columns, _, _ = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"{path} is not an Overseer status history file")
+        self._records_offset, self._record_size, _ = _layout(self.capacity, self.max_columns)
+
+    def _header(self) -> Tuple[int, int]:
+        _, _, _, count, written = _HEADER.unpack_from(self._mm, 0)
+        return count, written
+
+    @property
+    def columns(self) -> List[str]:
+        return _read_names(self._mm, self._header()[0])
+
+    def _numbers(self, written: int, last: int | None) -> range:
+        """Record numbers oldest-to-newest, optionally limited to the last ``last``."""
+        n = min(written, self.capacity)
+        if last is not None:
+            n = min(n, last)
+        return range(written - n, written)
+
+    def _read(self, last: int | None, read: Callable[[int], Any]) -> List[Any]:
+        """Apply ``read(offset)`` to each record in the window, oldest first.
+
+        A record whose stamp is not its own before and after ``read`` was
+        rewritten meanwhile; the window is then re-read from a fresh header,
+        and torn records are dropped after ``_READ_RETRIES`` attempts.
+        """
+        for attempt in range(_READ_RETRIES):
+            _, written = self._header()
+            out = []
+            torn = False
+            for number in self._numbers(written, last):
+                base = self._records_offset + (number % self.capacity) * self._record_size
+                seq = _seq(number)
+                if _SEQ.unpack_from(self._mm, base + _SEQ_OFFSET)[0] != seq:
+                    torn = True
+                    continue
+                item = read(base)
+                if _SEQ.unpack_from(self._mm, base + _SEQ_OFFSET)[0] != seq:
+                    torn = True
+                    continue
+                out.append(item)
+            if not torn or attempt == _READ_RETRIES - 1:
+                return out
+        return []
+
+    def series(
+        self, column: str, since: float | None = None, last: int | None = None
+    ) -> Tuple[List[float], List[float]]:
+        """Timestamps and values for one column, oldest first."""
+        columns = self.columns
+        if column not in columns:
+            return [], []
+        value_offset = _RECORD_HEAD.size + 4 * columns.index(column)
+        rows = self._read(
+            last,
+            lambda base: (
+                struct.unpack_from("<d", self._mm, base)[0],
+                struct.unpack_from("<f", self._mm, base + value_offset)[0],
+            ),
+        )
+        if since is not None:
+            rows = [row for row in rows if row[0] >= since]
+        return [ts for ts, _ in rows], [value for _, value in rows]
+
+    def modes(self, last: int | None = None) -> List[Tuple[float, str]]:
+        rows = self._read(last, lambda base: _RECORD_HEAD.unpack_from(self._mm, base)[:2])
+        return [(ts, MODE_NAMES.get(code, "UNKNOWN")) for ts, code in rows]
+
+    def as_array(self, last: int | None = None):
+        """Records as a numpy structured array (``ts``, ``mode``, ``values``), oldest first.
+
+        Returns a validated copy, so the writer cannot change it underneath
+        the caller; requires numpy.
+        """
+        if np is None:
+            raise RuntimeError("numpy is required for StatusHistoryReader.as_array")
+        dtype = np.dtype(
+            [
+                ("ts", "<f8"),
+                ("mode", "u1"),
+                ("_pad", "V3"),
+                ("seq", "<u4"),
+                ("values", "<f4", (self.max_columns,)),
+            ]
+        )
+        records = np.frombuffer(
+            self._mm, dtype=dtype, count=self.capacity, offset=self._records_offset
+        )
+        for attempt in range(_READ_RETRIES):
+            _, written = self._header()
+            numbers = np.arange(self._numbers(written, last).start, written, dtype=np.int64)
+            slots = numbers % self.capacity
+            expected = (numbers % 0xFFFFFFFF + 1).astype(np.uint32)
+            before = records["seq"][slots]
+            arr = records[slots]
+            valid = (before == expected) & (records["seq"][slots] == expected)
+            if valid.all():
+                return arr
+            if attempt == _READ_RETRIES - 1:
+                return arr[valid]
+        return arr
+
+    def frame(self, columns: Sequence[str] | None = None, last: int | None = None):
+        """Dict of ``{"ts": ..., column: ...}`` numpy arrays, ready for charting."""
+        arr = self.as_array(last)
+        names = self.columns
+        wanted = names if columns is None else [c for c in columns if c in names]
+        out = {"ts": arr["ts"]}
+        for name in wanted:
+            out[name] = arr["values"][:, names.index(name)]
+        return out
+
+    def close(self) -> None:
+        self._mm.close()
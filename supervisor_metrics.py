@@ -0,0 +1,231 @@
+"""Fixed-memory windowed metrics for module supervisors.
+
+Counters and quantile sketches are kept in two time-bucketed rings: 12 x 5s
+slots for the last minute and 60 x 60s slots for the last 15 minutes / hour.
+A slot is lazily reset the first time it is reused, so recording is O(1) and
+memory never grows with event volume or uptime.
+"""
+
+from __future__ import annotations
+
+import time
+from threading import Lock
+from typing import Any, Callable, Dict, List, Tuple
+
+from core_infrastructure.event_bus_interface.event_bus import log_linear_index, log_linear_value
+
+# Window name -> seconds. Windows up to a minute read the fine ring.
+WINDOWS: Dict[str, int] = {"1m": 60, "15m": 900, "1h": 3600}
+
+_FINE = (5, 12)
+_COARSE = (60, 60)
+
+# Sketch range: values scaled past 48 bits are clamped into the top bucket.
+_MAX_BITS = 48
+
+
+def _window_seconds(window: str | int | float) -> float:
+    if isinstance(window, str):
+        try:
+            return float(WINDOWS[window])
+        except KeyError:
+            raise ValueError(f"Unknown metrics window: {window}") from None
+    return float(window)
+
+
+class _Ring:
+    """Ring of ``slots`` buckets, each covering ``slot_sec`` seconds."""
+
+    __slots__ = ("slot_sec", "size", "epochs", "values", "factory")
+
+    def __init__(self, slot_sec: int, size: int, factory: Callable[[], Any]) -> None:
+        self.slot_sec = slot_sec
+        self.size = size
+        self.epochs = [-1] * size
+        self.factory = factory
+        self.values: List[Any] = [None] * size
+
+    def current(self, now: float) -> Tuple[int, Any]:
+        epoch = int(now // self.slot_sec)
+        index = epoch % self.size
+        if self.epochs[index] != epoch:
+            self.epochs[index] = epoch
+            self.values[index] = self.factory()
+        return index, self.values[index]
+
+    def live(self, now: float, seconds: float) -> List[Any]:
+        """Slots overlapping the last ``seconds`` (rounded up to whole slots)."""
+        epoch = int(now // self.slot_sec)
+        span = min(self.size, max(1, -(-int(seconds) // self.slot_sec)))
+        oldest = epoch - span + 1
+        return [
+            self.values[i]
+            for i in range(self.size)
+            if oldest <= self.epochs[i] <= epoch
+        ]
+
+
+def _rings(factory: Callable[[], Any]) -> Tuple[_Ring, _Ring]:
+    return _Ring(*_FINE, factory), _Ring(*_COARSE, factory)
+
+
+class _Cell:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+
+class WindowedCounter:
+    """Monotonic counter that can also report its sum over recent windows."""
+
+    __slots__ = ("total", "_fine", "_coarse")
+
+    def __init__(self) -> None:
+        self.total = 0.0
+        self._fine, self._coarse = _rings(_Cell)
+
+    def add(self, amount: float, now: float) -> None:
+        self.total += amount
+        self._fine.current(now)[1].value += amount
+        self._coarse.current(now)[1].value += amount
+
+    def sum(self, seconds: float, now: float) -> float:
+        ring = self._fine if seconds <= _FINE[0] * _FINE[1] else self._coarse
+        return sum((cell.value for cell in ring.live(now, seconds)), 0.0)
+
+
+class WindowedQuantile:
+    """Sliding-window quantile sketch over non-negative values.
+
+    Values are scaled to integers (``scale=1e6`` keeps microsecond resolution
+    for latencies given in seconds) and counted in sparse log-linear buckets,
+    so each slot holds at most a few hundred entries regardless of volume.
+    """
+
+    __slots__ = ("scale", "count", "_fine", "_coarse")
+
+    def __init__(self, scale: float = 1e6) -> None:
+        self.scale = scale
+        self.count = 0
+        self._fine, self._coarse = _rings(dict)
+
+    def add(self, value: float, now: float) -> None:
+        index = log_linear_index(max(0, int(value * self.scale)), _MAX_BITS)
+        self.count += 1
+        for ring in (self._fine, self._coarse):
+            slot = ring.current(now)[1]
+            slot[index] = slot.get(index, 0) + 1
+
+    def quantiles(self, seconds: float, now: float, *qs: float) -> List[float]:
+        ring = self._fine if seconds <= _FINE[0] * _FINE[1] else self._coarse
+        merged: Dict[int, int] = {}
+        for slot in ring.live(now, seconds):
+            for index, count in slot.items():
+                merged[index] = merged.get(index, 0) + count
+        total = sum(merged.values())
+        if total == 0:
+            return [0.0 for _ in qs]
+
+        targets = sorted((max(1, int(q * total + 0.5)), i) for i, q in enumerate(qs))
+        results = [0.0] * len(qs)
+        seen = 0
+        t = 0
+        for index in sorted(merged):
+            seen += merged[index]
+            while t < len(targets) and seen >= targets[t][0]:
+                results[targets[t][1]] = log_linear_value(index) / self.scale
+                t += 1
+            if t == len(targets):
+                break
+        return results
+
+
+class MetricsStore:
+    """Named counters, gauges and quantile sketches for one supervisor."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._lock = Lock()
+        self._counters: Dict[str, WindowedCounter] = {}
+        self._gauges: Dict[str, Tuple[float, float]] = {}
+        self._sketches: Dict[str, WindowedQuantile] = {}
+
+    # -- recording --------------------------------------------------------
+
+    def incr(self, name: str, amount: float = 1.0) -> None:
+        with self._lock:
+            counter = self._counters.get(name)
+            if counter is None:
+                counter = self._counters[name] = WindowedCounter()
+            counter.add(amount, self._clock())
+
+    def set_gauge(self, name: str, value: float) -> None:
+        with self._lock:
+            self._gauges[name] = (float(value), self._clock())
+
+    def observe(self, name: str, value: float) -> None:
+        with self._lock:
+            sketch = self._sketches.get(name)
+            if sketch is None:
+                sketch = self._sketches[name] = WindowedQuantile()
+            sketch.add(value, self._clock())
+
+    # -- reading ----------------------------------------------------------
+
+    def total(self, name: str) -> float:
+        with self._lock:
+            counter = self._counters.get(name)
+            return counter.total if counter is not None else 0.0
+
+    def count(self, name: str, window: str | float = "1m") -> float:
+        seconds = _window_seconds(window)
+        with self._lock:
+            counter = self._counters.get(name)
+            return counter.sum(seconds, self._clock()) if counter is not None else 0.0
+
+    def rate(self, name: str, window: str | float = "1m") -> float:
+        """Events per second over ``window``."""
+        return self.count(name, window) / _window_seconds(window)
+
+    def ratio(self, numerator: str, denominator: str, window: str | float = "1m") -> float:
+        """``numerator / denominator`` over the same window; 0.0 when empty."""
+        den = self.count(denominator, window)
+        return self.count(numerator, window) / den if den > 0 else 0.0
+
+    def gauge(self, name: str, default: float | None = None) -> float | None:
+        with self._lock:
+            entry = self._gauges.get(name)
+            return entry[0] if entry is not None else default
+
+    def quantile(self, name: str, q: float, window: str | float = "1m") -> float:
+        return self.quantiles(name, (q,), window)[0]
+
+    def quantiles(
+        self, name: str, qs: Tuple[float, ...] = (0.5, 0.95, 0.99), window: str | float = "1m"
+    ) -> List[float]:
+        seconds = _window_seconds(window)
+        with self._lock:
+            sketch = self._sketches.get(name)
+            if sketch is None:
+                return [0.0 for _ in qs]
+            return sketch.quantiles(seconds, self._clock(), *qs)
+
+    def snapshot(self, window: str | float = "1m") -> Dict[str, Any]:
+        """Flat view of every metric over ``window``, for health snapshots."""
+        with self._lock:
+            counters = list(self._counters)
+            gauges = {name: value for name, (value, _) in self._gauges.items()}
+            sketches = list(self._sketches)
+
+        out: Dict[str, Any] = {}
+        for name in counters:
+            out[f"{name}_total"] = self.total(name)
+            out[f"{name}_{window}"] = self.count(name, window)
+        out.update(gauges)
+        for name in sketches:
+            p50, p95, p99 = self.quantiles(name, (0.5, 0.95, 0.99), window)
+            out[f"{name}_p50"] = p50
+            out[f"{name}_p95"] = p95
+            out[f"{name}_p99"] = p99
+        return out
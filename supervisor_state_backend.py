@@ -0,0 +1,228 @@
+"""Pluggable storage for supervisor counters shared across worker processes.
+
+Each process owns one shard per supervisor: the totals of the counters it
+incremented through ``ModuleSupervisor.incr_counter``. ``sync`` writes the
+local shards that changed and folds the fleet-wide sums back into every
+supervisor's ``state``, so health snapshots describe all workers, not just
+the process the Overseer happens to run in.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from threading import Event, Lock, Thread
+from typing import Callable, Dict, Iterable, List, Mapping, Tuple
+
+from .module_supervisor_base import ModuleSupervisor
+
+# supervisor name -> counter -> value
+MergedCounters = Dict[str, Dict[str, float]]
+
+
+class SupervisorStateBackend(ABC):
+    """Where counter shards live and how they are merged."""
+
+    def __init__(self) -> None:
+        self._auto_stop: Event | None = None
+        self._auto_thread: Thread | None = None
+
+    @abstractmethod
+    def write_shards(self, shards: Mapping[str, Mapping[str, float]]) -> None:
+        """Persist this worker's shard for each supervisor in ``shards``."""
+
+    @abstractmethod
+    def read_merged(self) -> MergedCounters:
+        """Sum of every worker's shards, per supervisor."""
+
+    def sync(self, supervisors: Iterable[ModuleSupervisor]) -> None:
+        sups = list(supervisors)
+        shards: Dict[str, Dict[str, float]] = {}
+        for sup in sups:
+            shard = sup.take_counter_shard()
+            if shard is not None:
+                shards[sup.name] = shard
+        if shards:
+            self.write_shards(shards)
+
+        merged = self.read_merged()
+        for sup in sups:
+            totals = merged.get(sup.name)
+            if totals:
+                sup.apply_fleet_counters(totals)
+
+    def start_auto_sync(
+        self,
+        get_supervisors: Callable[[], Iterable[ModuleSupervisor]],
+        interval: float = 1.0,
+    ) -> None:
+        """Sync on a daemon thread; for workers that do not run the Overseer."""
+        if self._auto_thread is not None:
+            return
+        stop = self._auto_stop = Event()
+
+        def loop() -> None:
+            while not stop.wait(interval):
+                try:
+                    self.sync(get_supervisors())
+                except Exception as exc:
+                    print(f"[SUPERVISOR_STATE] Sync failed: {exc!r}")
+
+        self._auto_thread = Thread(target=loop, name="supervisor-state-sync", daemon=True)
+        self._auto_thread.start()
+
+    def close(self) -> None:
+        if self._auto_stop is not None:
+            self._auto_stop.set()
+        if self._auto_thread is not None:
+            self._auto_thread.join(timeout=5)
+            self._auto_thread = None
+
+
+class LocalStateBackend(SupervisorStateBackend):
+    """Single-process default: local counters already are the fleet view."""
+
+    def write_shards(self, shards: Mapping[str, Mapping[str, float]]) -> None:
+        return
+
+    def read_merged(self) -> MergedCounters:
+        return {}
+
+    def sync(self, supervisors: Iterable[ModuleSupervisor]) -> None:
+        return
+
+
+class SQLiteStateBackend(SupervisorStateBackend):
+    """One row per (supervisor, worker, counter) in a shared SQLite file.
+
+    Workers only ever upsert their own rows, so writers never contend on the
+    same keys. The merged view is one ``GROUP BY`` query, re-run only when
+    ``PRAGMA data_version`` shows another process committed (or this one
+    wrote) since the last read.
+
+    Each ``sync`` refreshes this worker's rows at most every third of
+    ``worker_ttl`` and deletes rows no worker has refreshed for
+    ``worker_ttl`` seconds, so exited workers drop out of the fleet sums.
+    The default ``hostname:pid`` id changes on restart; a process that
+    replays its journal on startup should pass a stable ``worker_id`` so its
+    recounted totals replace its old rows instead of adding to them.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "empire.db",
+        table: str = "supervisor_counters",
+        worker_id: str | None = None,
+        worker_ttl: float = 300.0,
+    ) -> None:
+        super().__init__()
+        if not table.isidentifier():
+            raise ValueError(f"Invalid counter table name: {table}")
+        self.db_path = db_path
+        self.table = table
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.worker_ttl = worker_ttl
+        self._heartbeat_at = 0.0
+
+        self._lock = Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                supervisor TEXT NOT NULL,
+                worker TEXT NOT NULL,
+                counter TEXT NOT NULL,
+                value REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (supervisor, worker, counter)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.commit()
+        self._data_version: int | None = None
+        self._merged: MergedCounters = {}
+
+    def write_shards(self, shards: Mapping[str, Mapping[str, float]]) -> None:
+        now = time.time()
+        rows: List[Tuple[str, str, str, float, float]] = [
+            (supervisor, self.worker_id, counter, float(value), now)
+            for supervisor, counters in shards.items()
+            for counter, value in counters.items()
+        ]
+        if not rows:
+            return
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    f"INSERT INTO {self.table} (supervisor, worker, counter, value, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT (supervisor, worker, counter) "
+                    "DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at",
+                    rows,
+                )
+            # Our own commits do not move data_version on this connection.
+            self._data_version = None
+
+    def sync(self, supervisors: Iterable[ModuleSupervisor]) -> None:
+        self._heartbeat()
+        super().sync(supervisors)
+
+    def _heartbeat(self) -> None:
+        """Keep this worker's rows alive and prune workers that went quiet."""
+        now = time.time()
+        if now - self._heartbeat_at < self.worker_ttl / 3:
+            return
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    f"UPDATE {self.table} SET updated_at = ? WHERE worker = ?",
+                    (now, self.worker_id),
+                )
+                self._conn.execute(
+                    f"DELETE FROM {self.table} WHERE updated_at < ?", (now - self.worker_ttl,)
+                )
+            self._data_version = None
+            self._heartbeat_at = now
+
+    def read_merged(self) -> MergedCounters:
+        with self._lock:
+            version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            if version == self._data_version:
+                return self._merged
+            merged: MergedCounters = {}
+            for supervisor, counter, total in self._conn.execute(
+                f"SELECT supervisor, counter, SUM(value) FROM {self.table} "
+                "GROUP BY supervisor, counter"
+            ):
+                merged.setdefault(supervisor, {})[counter] = total
+            self._merged = merged
+            self._data_version = version
+            return merged
+
+    def workers(self) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(f"SELECT DISTINCT worker FROM {self.table}").fetchall()
+        return [row[0] for row in rows]
+
+    def close(self) -> None:
+        super().close()
+        with self._lock:
+            self._conn.close()
+
+
+_backend: SupervisorStateBackend = LocalStateBackend()
+
+
+def get_state_backend() -> SupervisorStateBackend:
+    return _backend
+
+
+def set_state_backend(backend: SupervisorStateBackend) -> None:
+    """Install the process-wide backend (e.g. ``SQLiteStateBackend()`` per worker)."""
+    global _backend
+    _backend = backend